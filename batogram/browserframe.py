@@ -8,10 +8,9 @@ import send2trash
 from pathlib import Path
 from typing import Optional, List, Tuple, Callable
 
-from batogram import get_asset_path
 from batogram.browseractionsmodal import BrowserActionsModal, BrowserActionsSettings, BrowserAction
 from .external.tooltip import ToolTip
-from .imagebutton import ImageButton
+from .imagebutton import ImageButton, load_asset_image
 from .modalwindow import ModalWindow
 
 
@@ -145,8 +144,8 @@ class BrowserFrame(tk.Frame):
 
         self._file_list_entries: List[Tuple[str, str]] = []
 
-        self._image_unflagged = tk.PhotoImage(file=get_asset_path("transparent.png"))
-        self._image_flagged = tk.PhotoImage(file=get_asset_path("flag-fill.png"))
+        self._image_unflagged = load_asset_image("transparent.png")
+        self._image_flagged = load_asset_image("flag-fill.png")
 
         self._path_var = tk.StringVar(value="")
         self._display_as_ref_var = tk.BooleanVar()
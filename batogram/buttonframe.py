@@ -17,26 +17,34 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
-import queue
+import sys
 import tkinter as tk
 import tkinter.messagebox
 import wave
+from collections import deque
 from enum import Enum
 from pathlib import Path
-from queue import SimpleQueue
-from typing import Type, Optional, Tuple
+from typing import Type, Optional, Tuple, Dict, Deque
 
 from .audiofileservice import AudioFileService
-from .constants import PLAYBACK_EVENT, PROGRAM_NAME
+from .constants import PROGRAM_NAME
 
 from .frames import DrawableFrame
 from .playbackmodal import PlaybackModal, PlaybackSettings
 from .playbackservice import PlaybackServiceImpl, PlaybackRequest, PlaybackEventHandler, PlaybackRequestTuple, \
-    EventClosureType, PlaybackSignal, PlaybackCursorEventHandler
+    EventClosureType, PlaybackSignal, PlaybackCursorEventHandler, CursorUpdateClosure
 from .spectrogrammouseservice import CursorMode
 from .external.tooltip import ToolTip
 from .imagebutton import ImageButton
 
+# Bound once at module level, as these are used repeatedly when drawing the buttons:
+_NORMAL, _DISABLED, _SUNKEN, _RAISED = tk.NORMAL, tk.DISABLED, tk.SUNKEN, tk.RAISED
+
+_OUTPUT_FILE_TYPES = (
+    ('audio files', '*.wav *.WAV'),
+    ('All files', '*.*')
+)
+
 
 class PlaybackState(Enum):
     PLAYBACK_STOPPED = 0
@@ -48,8 +56,24 @@ class PlaybackState(Enum):
     PLAYBACK_DISABLED = 6
 
 
+class PlaybackAction(Enum):
+    """The playback buttons the user can click."""
+    PLAY = 0
+    PAUSE = 1   # Toggles between pause and resume.
+    STOP = 2
+
+
 class ButtonFrame(DrawableFrame, PlaybackEventHandler):
     """A Frame containing the control buttons for a pane."""
+
+    # Flags to limit which groups of buttons are updated by draw. These don't overlap with
+    # the DrawableFrame flags:
+    DRAW_NAV = 1 << 4
+    DRAW_CURSOR = 1 << 5
+    DRAW_PLAYBACK = 1 << 6
+    DRAW_SYNC = 1 << 7
+    _DRAW_BUTTONS_ALL = DRAW_NAV | DRAW_CURSOR | DRAW_PLAYBACK | DRAW_SYNC
+
     _playback_settings: PlaybackSettings = PlaybackSettings()
 
     def __init__(self, parent, breadcrumb_service, action_target, data_context, program_directory, is_reference,
@@ -68,19 +92,24 @@ class ButtonFrame(DrawableFrame, PlaybackEventHandler):
         self._first_file_open = True
         self._t_range: Optional[Tuple[int, int]] = None
         self._settings = settings
+        # The (state, relief) last applied to each button, so that we can skip redundant updates:
+        self._applied: Dict[tk.Button, Tuple[str, Optional[str]]] = {}
 
         self._playback_processor.add_watcher(self, self._event_processor)  # Don't know why type hinting complains.
 
         col = 0
         small_gap = 10
 
-        self._event_closure_queue: SimpleQueue[EventClosureType] = SimpleQueue()
-        self.bind(PLAYBACK_EVENT, self._do_playback_event)
+        self._event_closure_queue: Deque[EventClosureType] = deque()
+        # Playback cursor updates are coalesced so that only the latest is drawn:
+        self._latest_cursor_offset: Optional[int] = None
+        self._cursor_dirty = False
+        self._drain_scheduled = False
 
         if not is_reference:
             self._sync_button = ImageButton(self, "arrow-right-circle-line.png", command=self.sync_command)
             self._sync_button.grid(row=0, column=col, padx=0, ipadx=0, sticky="NSEW")
-            ToolTip(self._sync_button, msg="Synchronize main graph axes from reference graph axes")
+            self._lazy_tip(self._sync_button, "Synchronize main graph axes from reference graph axes")
             col += 1
 
         left_space = tk.Label(self)
@@ -94,51 +123,51 @@ class ButtonFrame(DrawableFrame, PlaybackEventHandler):
 
         self._home_button = ImageButton(self, "fullscreen-line.png", command=home_command)
         self._home_button.grid(row=0, column=col, padx=0, ipadx=0, sticky="NSEW")
-        ToolTip(self._home_button, msg="Reset axis ranges to match input data")
+        self._lazy_tip(self._home_button, "Reset axis ranges to match input data")
         col += 1
 
         self._previous_button = ImageButton(self, "arrow-left-line.png",
                                             command=lambda: self._action_target.on_navigation_button(
                                               self._breadcrumb_service.previous_entry()))
         self._previous_button.grid(row=0, column=col, padx=0, ipadx=0, sticky="NSEW")
-        ToolTip(self._previous_button, msg="Revert to the previous zoom")
+        self._lazy_tip(self._previous_button, "Revert to the previous zoom")
         col += 1
 
         self._next_button = ImageButton(self, "arrow-right-line.png",
                                         command=lambda: self._action_target.on_navigation_button(
                                           self._breadcrumb_service.next_entry()))
         self._next_button.grid(row=0, column=col, padx=0, ipadx=0, sticky="NSEW")
-        ToolTip(self._next_button, msg="Reinstate the subsequent zoom")
+        self._lazy_tip(self._next_button, "Reinstate the subsequent zoom")
         col += 1
 
         self._zoom_button = ImageButton(self, "zoom-in-line.png",
                                         command=lambda: self._handle_cursor_mode(CursorMode.CURSOR_ZOOM))
         self._zoom_button.grid(row=0, column=col, padx=(small_gap, 0), ipadx=0, sticky="NSEW")
-        ToolTip(self._zoom_button, msg="Select zoom cursor: left mouse drag to zoom.\nHold shift to lock mode.")
+        self._lazy_tip(self._zoom_button, "Select zoom cursor: left mouse drag to zoom.\nHold shift to lock mode.")
         col += 1
 
         self._pan_button = ImageButton(self, "drag-move-2-line.png",
                                        command=lambda: self._handle_cursor_mode(CursorMode.CURSOR_PAN))
         self._pan_button.grid(row=0, column=col, padx=0, ipadx=0, sticky="NSEW")
-        ToolTip(self._pan_button, msg="Select pan cursor: left mouse drag to pan/scroll.\nHold shift to lock mode.")
+        self._lazy_tip(self._pan_button, "Select pan cursor: left mouse drag to pan/scroll.\nHold shift to lock mode.")
         col += 1
 
         self._play_button = ImageButton(self, "play-line.png",
                                         command=lambda: self._handle_play())
         self._play_button.grid(row=0, column=col, padx=(small_gap * 3, 0), ipadx=0, sticky="NSEW")
-        ToolTip(self._play_button, msg="Play the recording")
+        self._lazy_tip(self._play_button, "Play the recording")
         col += 1
 
         self._pause_button = ImageButton(self, "pause-line.png",
                                          command=lambda: self._handle_pause())
         self._pause_button.grid(row=0, column=col, padx=0, ipadx=0, sticky="NSEW")
-        ToolTip(self._pause_button, msg="Pause playback")
+        self._lazy_tip(self._pause_button, "Pause playback")
         col += 1
 
         self._stop_button = ImageButton(self, "stop-line.png",
                                         command=lambda: self._handle_stop())
         self._stop_button.grid(row=0, column=col, padx=0, ipadx=0, sticky="NSEW")
-        ToolTip(self._stop_button, msg="Stop playback")
+        self._lazy_tip(self._stop_button, "Stop playback")
         col += 1
 
         spacer = tk.Label(self)
@@ -148,18 +177,31 @@ class ButtonFrame(DrawableFrame, PlaybackEventHandler):
 
         self._refresh_button = ImageButton(self, "refresh-line.png", command=self._action_target.on_refresh)
         self._refresh_button.grid(row=0, column=col, padx=0, ipadx=0, sticky="NSEW")
-        ToolTip(self._refresh_button, msg="Redraw the spectrogram")
+        self._lazy_tip(self._refresh_button, "Redraw the spectrogram")
         col += 1
 
         if is_reference:
             self._sync_button = ImageButton(self, "arrow-left-circle-line.png", command=self.sync_command)
             self._sync_button.grid(row=0, column=col, padx=0, ipadx=0, sticky="NSEW")
-            ToolTip(self._sync_button, msg="Synchronize reference axes from main graph axes")
+            self._lazy_tip(self._sync_button, "Synchronize reference axes from main graph axes")
             col += 1
 
         self.columnconfigure(index=spacer1_index, weight=1)
         self.columnconfigure(index=spacer2_index, weight=1)
 
+    @staticmethod
+    def _lazy_tip(button: tk.Widget, msg: str):
+        """Defer creating the ToolTip for a button until the mouse first enters it."""
+        def on_first_enter(event):
+            # This binding stays in place, as before Python 3.13 unbinding it by funcid would remove
+            # every <Enter> binding on the widget, including the ToolTip's own. So just ignore it once
+            # the ToolTip exists:
+            if getattr(button, "my_tooltip", None) is None:
+                button.my_tooltip = ToolTip(button, msg=msg)  # Also keeps a reference to the ToolTip.
+                button.my_tooltip.spawn(event)
+
+        button.bind('<Enter>', on_first_enter, add='+')
+
     def set_t_range(self, t_range: Tuple[int, int]) -> None:
         """This is called by our parent to tell us the sample index range that corresponds to the graph width."""
         self._t_range = t_range
@@ -170,99 +212,150 @@ class ButtonFrame(DrawableFrame, PlaybackEventHandler):
     def set_playback_cursor_controller(self, playback_cursor_controller: PlaybackCursorEventHandler):
         self._playback_cursor_controller = playback_cursor_controller
 
+    # Per playback state, the (state, relief) of the play, pause and stop buttons respectively:
     _ui_states = {
         PlaybackState.PLAYBACK_STOP_PENDING:
-            [(tk.DISABLED, tk.RAISED),  # play
-             (tk.DISABLED, tk.RAISED),  # pause
-             (tk.DISABLED, tk.SUNKEN)  # stop
-             ],
+            ((_DISABLED, _RAISED),  # play
+             (_DISABLED, _RAISED),  # pause
+             (_DISABLED, _SUNKEN)  # stop
+             ),
         PlaybackState.PLAYBACK_STOPPED:
-            [(tk.NORMAL, tk.RAISED),  # play
-             (tk.DISABLED, tk.RAISED),  # pause
-             (tk.DISABLED, tk.RAISED)  # stop
-             ],
+            ((_NORMAL, _RAISED),  # play
+             (_DISABLED, _RAISED),  # pause
+             (_DISABLED, _RAISED)  # stop
+             ),
 
         PlaybackState.PLAYBACK_PLAY_PENDING:
-            [(tk.NORMAL, tk.SUNKEN),
-             (tk.DISABLED, tk.RAISED),
-             (tk.DISABLED, tk.RAISED)
-             ],
+            ((_NORMAL, _SUNKEN),
+             (_DISABLED, _RAISED),
+             (_DISABLED, _RAISED)
+             ),
         PlaybackState.PLAYBACK_PLAYING:
-            [(tk.NORMAL, tk.SUNKEN),
-             (tk.NORMAL, tk.RAISED),
-             (tk.NORMAL, tk.RAISED)
-             ],
+            ((_NORMAL, _SUNKEN),
+             (_NORMAL, _RAISED),
+             (_NORMAL, _RAISED)
+             ),
 
         PlaybackState.PLAYBACK_PAUSE_PENDING:
-            [(tk.NORMAL, tk.SUNKEN),
-             (tk.DISABLED, tk.SUNKEN),
-             (tk.DISABLED, tk.RAISED)
-             ],
+            ((_NORMAL, _SUNKEN),
+             (_DISABLED, _SUNKEN),
+             (_DISABLED, _RAISED)
+             ),
         PlaybackState.PLAYBACK_PAUSED:
-            [(tk.NORMAL, tk.SUNKEN),
-             (tk.NORMAL, tk.SUNKEN),
-             (tk.NORMAL, tk.RAISED)
-             ],
+            ((_NORMAL, _SUNKEN),
+             (_NORMAL, _SUNKEN),
+             (_NORMAL, _RAISED)
+             ),
 
         PlaybackState.PLAYBACK_DISABLED:
-            [(tk.DISABLED, tk.RAISED),
-             (tk.DISABLED, tk.RAISED),
-             (tk.DISABLED, tk.RAISED)
-             ]
+            ((_DISABLED, _RAISED),
+             (_DISABLED, _RAISED),
+             (_DISABLED, _RAISED)
+             )
     }
 
-    def draw(self, draw_scope: int = DrawableFrame.DRAW_ALL):
-        super().draw(draw_scope)
-
-        # Enable the buttons according to the breadcrumb service state:
-        self._home_button['state'] = tk.NORMAL  # We can always "home".
-        self._previous_button['state'] = tk.NORMAL if self._breadcrumb_service.is_previous_available() else tk.DISABLED
-        self._next_button['state'] = tk.NORMAL if self._breadcrumb_service.is_next_available() else tk.DISABLED
-
-        # Enable the sync button if there is a source, and if this panel has data:
-        self._sync_button['state'] = tk.NORMAL if self._sync_source and self._dc.afs else tk.DISABLED
+    # The same table as a tuple indexed by PlaybackState value, avoiding enum hashing in draw:
+    _UI_STATES = tuple(map(_ui_states.__getitem__, sorted(PlaybackState, key=lambda ps: ps.value)))
 
-        # Enable the refresh button if this panel has data:
-        self._refresh_button['state'] = tk.NORMAL if self._dc.afs else tk.DISABLED
+    # Reliefs for the zoom and pan buttons in each cursor mode:
+    _CURSOR_RELIEFS = {
+        CursorMode.CURSOR_ZOOM: (_SUNKEN, _RAISED),
+        CursorMode.CURSOR_PAN: (_RAISED, _SUNKEN)
+    }
 
-        relief = tk.SUNKEN if self._cursor_mode == CursorMode.CURSOR_ZOOM else tk.RAISED
-        self._zoom_button['state'] = tk.NORMAL
-        self._zoom_button.configure(relief=relief)
+    # The playback state transitions the user can make by clicking a button, and the signal to
+    # send the playback service, if any. Combinations not listed are ignored:
+    _TRANSITIONS = {
+        (PlaybackState.PLAYBACK_STOPPED, PlaybackAction.PLAY): (PlaybackState.PLAYBACK_PLAY_PENDING, None),
+        (PlaybackState.PLAYBACK_PLAYING, PlaybackAction.PAUSE):
+            (PlaybackState.PLAYBACK_PAUSE_PENDING, PlaybackSignal.SIGNAL_PAUSE),
+        (PlaybackState.PLAYBACK_PAUSED, PlaybackAction.PAUSE):
+            (PlaybackState.PLAYBACK_PLAYING, PlaybackSignal.SIGNAL_NONE),
+        (PlaybackState.PLAYBACK_PLAYING, PlaybackAction.STOP):
+            (PlaybackState.PLAYBACK_STOP_PENDING, PlaybackSignal.SIGNAL_STOP),
+        (PlaybackState.PLAYBACK_PAUSED, PlaybackAction.STOP):
+            (PlaybackState.PLAYBACK_STOP_PENDING, PlaybackSignal.SIGNAL_STOP),
+    }
 
-        relief = tk.SUNKEN if self._cursor_mode == CursorMode.CURSOR_PAN else tk.RAISED
-        self._pan_button['state'] = tk.NORMAL
-        self._pan_button.configure(relief=relief)
+    def draw(self, draw_scope: int = DrawableFrame.DRAW_ALL):
+        super().draw(draw_scope)
 
-        a = self._dc.afs
-        if a is not None:
-            # Playback controls:
-            ui_state = self._ui_states[self._playback_state]
+        # Any draw requested by the pane updates all the buttons, as it may follow a change of data:
+        if draw_scope & DrawableFrame.DRAW_ALL:
+            draw_scope |= self._DRAW_BUTTONS_ALL
+
+        if draw_scope & self.DRAW_NAV:
+            # Enable the buttons according to the breadcrumb service state:
+            self._apply(self._home_button, _NORMAL)  # We can always "home".
+            self._apply(self._previous_button,
+                        _NORMAL if self._breadcrumb_service.is_previous_available() else _DISABLED)
+            self._apply(self._next_button,
+                        _NORMAL if self._breadcrumb_service.is_next_available() else _DISABLED)
+
+            # Enable the refresh button if this panel has data:
+            self._apply(self._refresh_button, _NORMAL if self._dc.afs else _DISABLED)
+
+        if draw_scope & self.DRAW_SYNC:
+            # Enable the sync button if there is a source, and if this panel has data:
+            self._apply(self._sync_button, _NORMAL if self._sync_source and self._dc.afs else _DISABLED)
+
+        if draw_scope & self.DRAW_CURSOR:
+            zoom_relief, pan_relief = self._CURSOR_RELIEFS[self._cursor_mode]
+            self._apply(self._zoom_button, _NORMAL, zoom_relief)
+            self._apply(self._pan_button, _NORMAL, pan_relief)
+
+        if draw_scope & self.DRAW_PLAYBACK:
+            state = self._playback_state if self._dc.afs is not None else PlaybackState.PLAYBACK_DISABLED
+            play_sr, pause_sr, stop_sr = self._UI_STATES[state.value]
+            self._apply(self._play_button, *play_sr)
+            self._apply(self._pause_button, *pause_sr)
+            self._apply(self._stop_button, *stop_sr)
+
+    def _apply(self, button: tk.Button, state: str, relief: Optional[str] = None):
+        """
+        Update the state and relief of a button in a single configure call, skipping the Tcl
+        round trip if nothing has changed. Buttons that never change relief pass None.
+        """
+        if self._applied.get(button) == (state, relief):
+            return
+        if relief is None:
+            button.configure(state=state)
         else:
-            ui_state = self._ui_states[PlaybackState.PLAYBACK_DISABLED]
-
-        self._play_button['state'] = ui_state[0][0]
-        self._play_button.configure(relief=ui_state[0][1])
-        self._pause_button['state'] = ui_state[1][0]
-        self._pause_button.configure(relief=ui_state[1][1])
-        self._stop_button['state'] = ui_state[2][0]
-        self._stop_button.configure(relief=ui_state[2][1])
+            button.configure(state=state, relief=relief)
+        self._applied[button] = (state, relief)
 
     def _handle_cursor_mode(self, mode: CursorMode):
         self._cursor_mode = mode
-        self.draw()
+        self.request_draw(self.DRAW_CURSOR)
         self._action_target.on_cursor_mode(mode)
 
     def set_sync_source(self, sync_source):
         self._sync_source = sync_source
         # Update button enablement:
-        self.draw()
+        self.request_draw(self.DRAW_SYNC | self.DRAW_NAV)
 
     def sync_command(self):
         if self._sync_source:
             self._action_target.apply_sync_data(self._sync_source.get_sync_data())
 
+    def _transition(self, action: PlaybackAction) -> bool:
+        """Apply a user action to the playback state, returning False if it isn't valid in the current state."""
+        transition = self._TRANSITIONS.get((self._playback_state, action))
+        if transition is None:
+            return False
+        new_state, signal = transition
+        self._set_playback_state(new_state)
+        if signal is not None:
+            self._playback_processor.signal(signal)
+        return True
+
+    def _set_playback_state(self, new_state: PlaybackState):
+        if new_state != self._playback_state:
+            self._playback_state = new_state
+            self.request_draw(self.DRAW_PLAYBACK)
+
     def _handle_play(self):
-        if self._playback_state == PlaybackState.PLAYBACK_STOPPED:
+        if (self._playback_state, PlaybackAction.PLAY) in self._TRANSITIONS:
             ok_clicked: bool = False
 
             def on_ok():
@@ -271,7 +364,11 @@ class ButtonFrame(DrawableFrame, PlaybackEventHandler):
 
             # Pass through the sample rate we should use for playback (not necessarily the
             # file sample rate):
-            self._playback_settings.settings_sample_rate = int(self._settings.settings_sample_rate)
+            sr = int(self._settings.settings_sample_rate)
+            if sr <= 0:
+                tk.messagebox.showerror(PROGRAM_NAME, "Invalid sample rate: {}".format(sr))
+                return
+            self._playback_settings.settings_sample_rate = sr
 
             modal = PlaybackModal(self, self._playback_settings, on_ok)
             modal.grab_set()
@@ -286,9 +383,6 @@ class ButtonFrame(DrawableFrame, PlaybackEventHandler):
                 if rendering_data.bytes_per_value != 2 or not 1 <= rendering_data.channels <= 2:
                     tk.messagebox.showerror(PROGRAM_NAME, "Playback is limited to 16 bit PCM data in 1 or 2 channels")
                     return
-                sr: int = self._settings.settings_sample_rate
-                if not sr > 0:
-                    print("Sample rate is insane: {}".format(sr))
 
                 wave_file: Optional[wave.Wave_write] = None
                 if self._playback_settings.write_to_file:
@@ -311,30 +405,18 @@ class ButtonFrame(DrawableFrame, PlaybackEventHandler):
                 playback_args: PlaybackRequestTuple = request, self._event_processor
 
                 # It all seems to be in order, so kick off the playback:
-                self._playback_state = PlaybackState.PLAYBACK_PLAY_PENDING
-                self.draw()
-                self._playback_processor.submit(playback_args)
+                if self._transition(PlaybackAction.PLAY):
+                    self._playback_processor.submit(playback_args)
 
     def _handle_pause(self):
-        if self._playback_state == PlaybackState.PLAYBACK_PLAYING:
-            self._playback_state = PlaybackState.PLAYBACK_PAUSE_PENDING
-            self._playback_processor.signal(PlaybackSignal.SIGNAL_PAUSE)
-        elif self._playback_state == PlaybackState.PLAYBACK_PAUSED:
-            self._playback_state = PlaybackState.PLAYBACK_PLAYING
-            self._playback_processor.signal(PlaybackSignal.SIGNAL_NONE)
-
-        self.draw()
+        self._transition(PlaybackAction.PAUSE)
 
     def _handle_stop(self):
-        self._playback_state = PlaybackState.PLAYBACK_STOP_PENDING
-        self.draw()
-
-        self._playback_processor.signal(PlaybackSignal.SIGNAL_STOP)
+        self._transition(PlaybackAction.STOP)
 
     def on_play_started(self):
         """Notification callback called in the thread of the playback service."""
-        self._playback_state = PlaybackState.PLAYBACK_PLAYING
-        self.draw()
+        self._set_playback_state(PlaybackState.PLAYBACK_PLAYING)
 
     def on_play_cancelled(self):
         """Notification callback called in the thread of the playback service."""
@@ -343,17 +425,14 @@ class ButtonFrame(DrawableFrame, PlaybackEventHandler):
 
     def on_play_finished(self):
         """Notification callback called in the thread of the playback service."""
-        self._playback_state = PlaybackState.PLAYBACK_STOPPED
-        self.draw()
+        self._set_playback_state(PlaybackState.PLAYBACK_STOPPED)
 
     def on_play_paused(self):
         """Notification callback called in the thread of the playback service."""
-        self._playback_state = PlaybackState.PLAYBACK_PAUSED
-        self.draw()
+        self._set_playback_state(PlaybackState.PLAYBACK_PAUSED)
 
     def on_play_resumed(self):
-        self._playback_state = PlaybackState.PLAYBACK_PLAYING
-        self.draw()
+        self._set_playback_state(PlaybackState.PLAYBACK_PLAYING)
 
     def on_exception(self, e: Type[Exception]):
         """Notificiation callback called in the thread of the playback service."""
@@ -361,12 +440,10 @@ class ButtonFrame(DrawableFrame, PlaybackEventHandler):
         raise e
 
     def on_broadcast_busy(self):
-        self._playback_state = PlaybackState.PLAYBACK_DISABLED
-        self.draw()
+        self._set_playback_state(PlaybackState.PLAYBACK_DISABLED)
 
     def on_broadcast_ready(self):
-        self._playback_state = PlaybackState.PLAYBACK_STOPPED
-        self.draw()
+        self._set_playback_state(PlaybackState.PLAYBACK_STOPPED)
 
     def on_show_update_playback_cursor(self, offset: int):
         if self._playback_cursor_controller:
@@ -387,32 +464,50 @@ class ButtonFrame(DrawableFrame, PlaybackEventHandler):
         """
 
         # Executed in the playback thread.
-        # We can't attach payload data to a tkinter event, so we maintain a parallel queue
-        # of event payloads:
-        try:
-            self._event_closure_queue.put(event_closure)  # This is advertised as thread safe.
-            self.event_generate(PLAYBACK_EVENT)  # Who knows if this is thread safe - we have no alternative.
-        except queue.Full:
-            print("Playback event closure queue is full")
-
-    def _do_playback_event(self, _):
+        # deque append and popleft are atomic, so no lock is needed:
+        if isinstance(event_closure, CursorUpdateClosure):
+            # Cursor updates are superseded by later ones, so just note the latest offset:
+            self._latest_cursor_offset = event_closure.offset
+            self._cursor_dirty = True
+        else:
+            self._event_closure_queue.append(event_closure)
+
+        # Tkinter marshals after_idle to the UI thread. Only one drain is scheduled at a time, so
+        # a burst of events is handled in a single callback:
+        if not self._drain_scheduled:
+            self._drain_scheduled = True
+            self.after_idle(self._drain_events)
+
+    def _drain_events(self):
         """
             Threading: this method is called by tkinter in the UI thread.
         """
 
-        try:
-            event_closure: EventClosureType = self._event_closure_queue.get()
-            event_closure(self)  # No idea why typing hinting complains about this.
-        except queue.Empty:
-            print("Playback event closure queue is unexecptedly empty")
+        # Clear the flag before draining, so that anything queued from now on schedules another drain:
+        self._drain_scheduled = False
+
+        # Draw the latest cursor position first, as any queued events (such as hiding the cursor)
+        # come later:
+        if self._cursor_dirty:
+            self._cursor_dirty = False
+            self.on_show_update_playback_cursor(self._latest_cursor_offset)
+
+        # Drain everything that has been queued, so that nothing is lost if events arrive faster
+        # than we handle them:
+        while True:
+            try:
+                event_closure: EventClosureType = self._event_closure_queue.popleft()
+            except IndexError:
+                break
+            # Don't let one failing closure strand the others queued behind it, but report the failure
+            # through tkinter as it would have been if raised directly from a callback:
+            try:
+                event_closure(self)  # No idea why typing hinting complains about this.
+            except Exception:
+                self.report_callback_exception(*sys.exc_info())
 
     def _open_file_dialog(self) -> str:
 
-        filetypes = (
-            ('audio files', '*.wav *.WAV'),
-            ('All files', '*.*')
-        )
-
         initialdir = None
         if self._first_file_open:
             self._first_file_open = False
@@ -420,7 +515,7 @@ class ButtonFrame(DrawableFrame, PlaybackEventHandler):
             # remembers where the user last navigated it to:
             initialdir = Path.home()
 
-        filepath: str = tk.filedialog.asksaveasfilename(title="Playback output file", filetypes=filetypes,
+        filepath: str = tk.filedialog.asksaveasfilename(title="Playback output file", filetypes=_OUTPUT_FILE_TYPES,
                                                         initialdir=initialdir)
         suffix = ".wav"
         if filepath and not filepath.lower().endswith(suffix):
@@ -17,13 +17,40 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
+import os
+import tempfile
+import threading
 from typing import Optional
 
 import numpy as np
+from platformdirs import user_cache_dir
 
 from . import get_colour_map_path
 from .appsettings import TD_MAPS, DEFAULT_COLOUR_MAP
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None     # Numba is optional: we fall back to numpy if it isn't installed.
+
+if njit is not None:
+    # Deliberately serial: the main and reference rendering threads call this at the same time, and
+    # numba's default threading layer aborts the process on concurrent parallel launches.
+    @njit(cache=True)
+    def _apply_cmap32(inputdata, cmap32, num_steps, outputdata):
+        """Scale, clip and look up each value of a 2D input in a single pass."""
+        rows, columns = inputdata.shape
+        for i in range(rows):
+            for j in range(columns):
+                k = int(inputdata[i, j] * num_steps)
+                if k < 0:
+                    k = 0
+                elif k >= num_steps:
+                    k = num_steps - 1
+                outputdata[i, j] = cmap32[k]
+else:
+    _apply_cmap32 = None
+
 
 class ColourMap:
     """The colour map is used to render spectrograms in the UI."""
@@ -35,6 +62,7 @@ class ColourMap:
         """
 
         self._cmap = None
+        self._cmap32 = None
         self._num_steps: Optional[int] = None
         self._polyfilla_colour: Optional[str] = None
 
@@ -47,40 +75,122 @@ class ColourMap:
             NB remove the initial row of column headers from files, if present.
         """
 
-        colour_mapping_path = get_colour_map_path(map_file)
-        raw_cmap: np.ndarray = np.genfromtxt(colour_mapping_path, delimiter=',', dtype=np.uint8)
-
-        # Some formats have the value in the first column, which is not required:
-        if raw_cmap.shape[1] == 4:
-            raw_cmap = np.delete(raw_cmap, 0, axis=1)
+        raw_cmap = self._read_map_file(map_file)
         self._cmap = raw_cmap
         self._num_steps = len(self._cmap)
 
+        # The same map packed as one little endian RGBA value per entry, so that mapping is a single
+        # 4 byte gather per pixel and the result can be handed straight to PIL:
+        self._cmap32 = (raw_cmap[:, 0].astype(np.uint32)
+                        | (raw_cmap[:, 1].astype(np.uint32) << 8)
+                        | (raw_cmap[:, 2].astype(np.uint32) << 16)
+                        | np.uint32(0xFF000000)).astype('<u4')
+
         # Calculate the "lowest" colour as a string:
         entry = self._cmap[0]
         self._polyfilla_colour = "#{:02X}{:02X}{:02X}".format(*entry)
 
+    @staticmethod
+    def _read_map_file(map_file: str) -> np.ndarray:
+        """Get the RGB columns of a colour map file. The parsed map is cached as a .npy file, so that
+        only the first load of each map needs to parse the CSV."""
+
+        colour_mapping_path = get_colour_map_path(map_file)
+        # Hard coded values to match the application settings directory:
+        cache_path = os.path.join(user_cache_dir("batogram", "fitzharrys"), "colour_maps", map_file + ".npy")
+
+        try:
+            if os.path.getmtime(cache_path) >= os.path.getmtime(colour_mapping_path):
+                cached_cmap = np.load(cache_path)
+                if cached_cmap.ndim == 2 and cached_cmap.shape[1] == 3 and cached_cmap.dtype == np.uint8:
+                    return cached_cmap
+        except Exception:
+            pass    # Missing, stale, truncated or otherwise unreadable cache: fall back to the CSV.
+
+        # loadtxt parses in C, so it is much faster than genfromtxt. The value column of four column
+        # formats contains floats, so read as float and convert:
+        raw_cmap: np.ndarray = np.loadtxt(colour_mapping_path, delimiter=',', ndmin=2).astype(np.uint8)
+
+        # Some formats have the value in the first column, which is not required:
+        if raw_cmap.shape[1] == 4:
+            raw_cmap = raw_cmap[:, 1:]     # A view: there is no need to copy.
+
+        # Write the cache to a temporary file and rename it into place, so that a failed write can't
+        # leave a truncated cache file behind:
+        temp_path = None
+        try:
+            cache_dir = os.path.dirname(cache_path)
+            os.makedirs(cache_dir, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=cache_dir, suffix=".npy.tmp")
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, raw_cmap)
+            os.replace(temp_path, cache_path)
+        except OSError as e:
+            print("Unable to cache colour map {}: {}".format(map_file, str(e)))    # Not fatal.
+            if temp_path is not None and os.path.exists(temp_path):
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+
+        return raw_cmap
+
     def map(self, inputdata: np.ndarray) -> np.ndarray:
         """Replace each value in the input with an (RGB) tuple.
         The input data values must be in the range 0-1."""
 
-        # Create a new array for the output data, the same shape as the input data:
-        outputdata = np.zeros((*inputdata.shape, 3), dtype=np.uint8)  # Allow for RGB layers.
+        # Create a new array for the output data, the same shape as the input data. There is no need
+        # to initialise it, as every element is written below. The output is not reused between calls,
+        # because rendering pipeline steps cache their outputs, and the main and reference pipelines
+        # share this instance from separate threads:
+        outputdata = np.empty((*inputdata.shape, 3), dtype=np.uint8)  # Allow for RGB layers.
         # Do the mapping: each value in inputdata is replaced with an RGB from
         # cmap, according the input value.
 
+        # Scale and truncate to integer indexes in a single pass, without an intermediate float array:
+        indexes = np.empty(inputdata.shape, dtype=np.int32)
+        np.multiply(inputdata, self._num_steps, out=indexes, casting='unsafe')
+
         # ‘clip’ mode means that all indices that are too large are replaced by the index that addresses the last
         # element along that axis. Note that this disables indexing with negative numbers.
-
-        inputdata = (inputdata * self._num_steps).astype(int)
-        np.take(self._cmap, inputdata, axis=0, mode='clip', out=outputdata)
+        np.take(self._cmap, indexes, axis=0, mode='clip', out=outputdata)
 
         return outputdata
 
+    def map_rgba(self, inputdata: np.ndarray) -> np.ndarray:
+        """Replace each value in the input with a packed RGBA value, the same shape as the input.
+        The bytes of each value are in R, G, B, A order, so the result can be used as raw RGBA image data.
+        The input data values must be in the range 0-1."""
+
+        if _apply_cmap32 is not None and inputdata.ndim == 2:
+            outputdata = np.empty(inputdata.shape, dtype=self._cmap32.dtype)
+            _apply_cmap32(inputdata, self._cmap32, self._num_steps, outputdata)
+            return outputdata
+
+        indexes = np.empty(inputdata.shape, dtype=np.int32)
+        np.multiply(inputdata, self._num_steps, out=indexes, casting='unsafe')
+        np.clip(indexes, 0, self._num_steps - 1, out=indexes)
+
+        return self._cmap32[indexes]
+
     def get_polyfilla_colour(self) -> str:
         """Get the 'lowest' colour of the spectrum to be used for filling awkward gaps."""
         return self._polyfilla_colour
 
 
-# The single global instance of the colour map:
-instance: ColourMap = ColourMap(TD_MAPS[DEFAULT_COLOUR_MAP])
+# The single global instance of the colour map, accessed as colourmap.instance. It is created
+# on first access rather than at import time, as creating it means reading a file:
+_instance: Optional[ColourMap] = None
+_instance_lock = threading.Lock()
+
+
+def __getattr__(name: str):
+    global _instance
+    if name == "instance":
+        if _instance is None:
+            # The rendering pipelines run in their own threads, so guard against creating two instances:
+            with _instance_lock:
+                if _instance is None:
+                    _instance = ColourMap(TD_MAPS[DEFAULT_COLOUR_MAP])
+        return _instance
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
@@ -29,6 +29,9 @@ FontName = "helvetica"
 
 @dataclass
 class AxisRange:
+    # Explicit slots rather than dataclass(slots=True), which needs Python 3.10:
+    __slots__ = ("min", "max")
+
     min: float
     max: float
 
@@ -44,7 +47,12 @@ T = TypeVar('T')
 
 
 def clip_to_range(v: T, vmin: T, vmax: T) -> T:
-    """Clip the supplied value to the range provided. Generic typing via T."""
-    v = min(v, vmax)
-    v = max(v, vmin)
+    """Clip the supplied value to the range provided. Generic typing via T.
+    This is for scalars: use np.clip for arrays."""
+    # Plain comparisons are cheaper than calls to min and max. The order of the tests
+    # means that vmin wins if the range is inverted:
+    if v > vmax:
+        v = vmax
+    if v < vmin:
+        v = vmin
     return v
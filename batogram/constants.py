@@ -24,7 +24,6 @@ DATA_CHANGE_REF_EVENT = "<<OnDataChangeRef>>"  # Underlying data has change: for
 SPECTROGAM_COMPLETER_EVENT = "<<MainSpectrogramCompleter>>"
 AMPLITUDE_COMPLETER_EVENT = "<<MainAmplitudeCompleter>>"
 PROFILE_COMPLETER_EVENT = "<<MainProfileCompleter>>"
-PLAYBACK_EVENT = "<<PlaybackEvent>>"
 ZOOM_ORDER = 2  # This will move into settings. 0-2 is a useful range.
 COLOUR_MAPS_PATH = "colour_maps"
 ASSETS_PATH = "assets"
@@ -3,17 +3,47 @@
 # License: MIT
 
 from tkinter import *
-from time import time, localtime, strftime
+from time import time
 
 
-class ToolTip(Toplevel):
+class _ToolTipWindow(Toplevel):
+    """
+    The Toplevel that displays the text of a ToolTip. Only one ToolTip can be visible at a time,
+    so a single instance is shared by all of them.
+    """
+
+    def __init__(self, root):
+        Toplevel.__init__(self, root, bg='black', padx=1, pady=1)  # Initalise the Toplevel
+        self.withdraw()  # Hide initially
+        self.overrideredirect(True)  # The ToolTip Toplevel should have no frame or title bar
+        self.msgVar = StringVar(self)  # The msgVar will contain the text displayed by the ToolTip
+        self.owner = None  # The ToolTip currently using this window
+        Message(self, textvariable=self.msgVar, bg='#FFFFDD',
+                aspect=1000).grid()  # The test of the ToolTip is displayed in a Message widget
+
+
+_sharedWindow = None
+
+
+def _getSharedWindow(wdgt):
+    """
+    Returns the shared ToolTip window, creating it on first use
+    """
+    global _sharedWindow
+    if _sharedWindow is None or not _sharedWindow.winfo_exists():
+        # Parent the window on the root so that it outlives any transient windows that have ToolTips:
+        _sharedWindow = _ToolTipWindow(wdgt._root())
+    return _sharedWindow
+
+
+class ToolTip:
     """
     Provides a ToolTip widget for Tkinter.
     To apply a ToolTip to any Tkinter widget, simply pass the widget to the
     ToolTip constructor
     """
 
-    def __init__(self, wdgt, msg=None, msgFunc=None, delay=1, follow=True):
+    def __init__(self, wdgt, msg=None, msgFunc=None, delay=1, follow=True, refresh=0.25):
         """
         Initialize the ToolTip
 
@@ -23,30 +53,38 @@ class ToolTip(Toplevel):
           msgFunc: A function that retrieves a string to use as the ToolTip text
           delay:   The delay in seconds before the ToolTip appears (maybe float)
           follow:  If True, the ToolTip follows motion, otherwise hides
+          refresh: The minimum interval in seconds between calls to msgFunc during motion
         """
         self.wdgt = wdgt
-        self.parent = self.wdgt.master  # The parent of the ToolTip is the parent of the ToolTips widget
-        Toplevel.__init__(self, self.parent, bg='black', padx=1, pady=1)  # Initalise the Toplevel
-        self.withdraw()  # Hide initially
-        self.overrideredirect(True)  # The ToolTip Toplevel should have no frame or title bar
-
-        self.msgVar = StringVar()  # The msgVar will contain the text displayed by the ToolTip
+        # No Tk widgets are created here: the window is shared, and is created when first needed.
         if msg is None:
-            self.msgVar.set('No message provided')
+            self.msg = 'No message provided'
         else:
-            self.msgVar.set(msg)
+            self.msg = msg
         self.msgFunc = msgFunc
+        self.refresh = refresh
+        self._lastMsgTime = 0  # When msgFunc was last called
+        self._lastMsg = None  # The last message set from msgFunc
+        self._msgFuncFailed = False  # Set if msgFunc raises, after which it is no longer called
         self.delay = delay
         self.follow = follow
         self.visible = 0
         self.lastMotion = 0
-        Message(self, textvariable=self.msgVar, bg='#FFFFDD',
-                aspect=1000).grid()  # The test of the ToolTip is displayed in a Message widget
+        self._pendingMove = None  # The id of the pending motion update, if there is one
+        self._lastEventXY = (0, 0)  # The latest pointer position, in root coordinates
         self.wdgt.bind('<Enter>', self.spawn,
                        '+')  # Add bindings to the widget.  This will NOT override bindings that the widget already has
         self.wdgt.bind('<Leave>', self.hide, '+')
         self.wdgt.bind('<Motion>', self.move, '+')
 
+    def _window(self):
+        """
+        Returns the shared window if this ToolTip is using it, otherwise None
+        """
+        if _sharedWindow is not None and _sharedWindow.owner is self:
+            return _sharedWindow
+        return None
+
     def spawn(self, event=None):
         """
         Spawn the ToolTip.  This simply makes the ToolTip eligible for display.
@@ -55,17 +93,26 @@ class ToolTip(Toplevel):
         Arguments:
           event: The event that called this funciton
         """
+        window = _getSharedWindow(self.wdgt)
+        window.withdraw()
+        window.owner = self
+        window.msgVar.set(self.msg if self._lastMsg is None else self._lastMsg)
         self.visible = 1
-        self.after(int(self.delay * 1000), self.show)  # The after function takes a time argument in miliseconds
+        self._lastMsgTime = 0  # Refresh the message on the next motion, as it may have changed since the last visit
+        self.wdgt.after(int(self.delay * 1000), self.show)  # The after function takes a time argument in miliseconds
 
     def show(self):
         """
         Displays the ToolTip if the time delay has been long enough
         """
+        window = self._window()
+        if window is None:
+            return
         if self.visible == 1 and time() - self.lastMotion > self.delay:
             self.visible = 2
+            window.lift()  # Appear above any other windows, such as the one containing the widget
         if self.visible == 2:
-            self.deiconify()
+            window.deiconify()
 
     def move(self, event):
         """
@@ -75,17 +122,41 @@ class ToolTip(Toplevel):
           event: The event that called this function
         """
         self.lastMotion = time()
+        self._lastEventXY = (event.x_root, event.y_root)
         if not self.follow:  # If the follow flag is not set, motion within the widget will make the ToolTip dissapear
-            self.withdraw()
+            window = self._window()
+            if window is not None:
+                window.withdraw()
             self.visible = 1
-        self.geometry('+%i+%i' % (
-            event.x_root + 10, event.y_root + 10))  # Offset the ToolTip 10x10 pixes southwest of the pointer
-        try:
-            self.msgVar.set(
-                self.msgFunc())  # Try to call the message function.  Will not change the message if the message function is None or the message function fails
-        except:
-            pass
-        self.after(int(self.delay * 1000), self.show)
+        # Motion events can arrive far faster than the display refreshes, so just note the latest
+        # position and update the ToolTip from it at most once per frame:
+        if self._pendingMove is None:
+            self._pendingMove = self.wdgt.after(16, self._flushMove)
+
+    def _flushMove(self):
+        """
+        Applies the latest motion within the widget.
+        """
+        self._pendingMove = None
+        window = self._window()
+        if window is None:
+            return
+        x_root, y_root = self._lastEventXY
+        window.geometry('+%i+%i' % (
+            x_root + 10, y_root + 10))  # Offset the ToolTip 10x10 pixes southwest of the pointer
+        now = time()
+        msgFunc = self.msgFunc
+        if msgFunc is not None and not self._msgFuncFailed and now - self._lastMsgTime >= self.refresh:
+            self._lastMsgTime = now
+            try:
+                msg = msgFunc()
+            except Exception:
+                self._msgFuncFailed = True  # Keep the current message, and don't keep paying for a failing function
+            else:
+                if msg != self._lastMsg:  # Only set the Tk variable if the message has changed
+                    window.msgVar.set(msg)
+                    self._lastMsg = msg
+        self.wdgt.after(int(self.delay * 1000), self.show)
 
     def hide(self, event=None):
         """
@@ -95,42 +166,10 @@ class ToolTip(Toplevel):
           event: The event that called this function
         """
         self.visible = 0
-        self.withdraw()
-
-
-# def xrange2d(n, m):
-#     """
-#     Returns a generator of values in a 2d range
-#
-#     Arguments:
-#       n: The number of rows in the 2d range
-#       m: The number of columns in the 2d range
-#     Returns:
-#       A generator of values in a 2d range
-#     """
-#     return ((i, j) for i in xrange(n) for j in xrange(m))
-#
-
-def range2d(n, m):
-    """
-    Returns a list of values in a 2d range
-
-    Arguments:
-      n: The number of rows in the 2d range
-      m: The number of columns in the 2d range
-    Returns:
-      A list of values in a 2d range
-    """
-    return [(i, j) for i in range(n) for j in range(m)]
-
-
-def print_time():
-    """
-    Prints the current time in the following format:
-    HH:MM:SS.00
-    """
-    t = time()
-    timeString = 'time='
-    timeString += strftime('%H:%M:', localtime(t))
-    timeString += '%.2f' % (t % 60,)
-    return timeString
+        if self._pendingMove is not None:
+            self.wdgt.after_cancel(self._pendingMove)
+            self._pendingMove = None
+        window = self._window()
+        if window is not None:
+            window.withdraw()
+            window.owner = None
@@ -33,13 +33,21 @@ class FileInfoFrame(DrawableFrame):
         self._is_reference = is_reference
 
         self._label = tk.Label(self, text="", width=1, anchor=tk.CENTER)
+        # The text only depends on the file and the sample rate, so the label only needs updating
+        # when they change:
+        self._drawn_for = None
         self._label.grid(row=0, column=0, sticky="nsew")
         self.columnconfigure(0, weight=1)
 
     def draw(self, draw_scope: int = DrawableFrame.DRAW_ALL):
         super().draw(draw_scope)
-        text = ""
         a = self._dc.afs
+        sample_rate = self._settings.settings_sample_rate
+        # Avoid needlessly reconfiguring the label, which can cause a relayout:
+        if self._drawn_for is not None and self._drawn_for[0] is a and self._drawn_for[1] == sample_rate:
+            return
+        self._drawn_for = a, sample_rate
+
         if a is not None:
             md = a.get_metadata()
             if md.channels == 1:
@@ -52,8 +60,7 @@ class FileInfoFrame(DrawableFrame):
                 f = ""
 
             text = "{}: {:.1f} s at {:.1f} kHz, {}{}".format(
-                md.file_name, md.length_seconds,  self._settings.settings_sample_rate / 1000.0, c, f)
+                md.file_name, md.length_seconds,  sample_rate / 1000.0, c, f)
         else:
             text = "(reference view)" if self._is_reference else ""
-
         self._label.config(text=text)
@@ -35,10 +35,26 @@ class DrawableFrame(tk.Frame):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self._draw_scheduled = False
+        self._pending_draw_scope = 0
 
     def draw(self, draw_scope: int = DRAW_ALL):
         pass  # Subclasses may do drawing here, if they want.
 
+    def request_draw(self, draw_scope: int = DRAW_ALL):
+        """Request a draw at idle time, so that several requests in one event loop turn draw only once,
+        with the combined scope."""
+        self._pending_draw_scope |= draw_scope
+        if not self._draw_scheduled:
+            self._draw_scheduled = True
+            self.after_idle(self._flush_draw)
+
+    def _flush_draw(self):
+        draw_scope = self._pending_draw_scope
+        self._draw_scheduled = False
+        self._pending_draw_scope = 0
+        self.draw(draw_scope)
+
     def reset_draw(self, draw_scope: int = DRAW_ALL):
         pass  # Subclasses may use this hint to abandon any pending drawing.
 
@@ -63,7 +79,7 @@ class GraphFrame(DrawableFrame):
         if self._after_id:
             self.after_cancel(self._after_id)
         lag_ms = 500
-        self._after_id = self.after(lag_ms, self.draw)
+        self._after_id = self.after(lag_ms, self.request_draw)
 
     @staticmethod
     def _pipeline_error_handler(e):
@@ -19,20 +19,21 @@
 # SOFTWARE.
 
 from dataclasses import dataclass
-from typing import Optional, NoReturn, Callable
+from types import MappingProxyType
+from typing import Optional, Callable
 
 from .common import AxisRange
 from .frames import DrawableFrame
 
 borderwidth = 10
 
-SUPPORTED_FFT_SAMPLES = [64, 128, 256, 512, 1024, 2048, 4096, 8192]
+SUPPORTED_FFT_SAMPLES = (64, 128, 256, 512, 1024, 2048, 4096, 8192)
 DEFAULT_FFT_SAMPLES_INDEX = 3
 
 ADAPTIVE_FFT_SAMPLES = -1  # Note that the range of auto values is defined elsewhere.
-FFT_SAMPLES_OPTIONS = {ADAPTIVE_FFT_SAMPLES: "Auto",
-                       64: "64", 128: "128", 256: "256",
-                       512: "512", 1024: "1024", 2048: "2048", 4096: "4096"}
+FFT_SAMPLES_OPTIONS = MappingProxyType({ADAPTIVE_FFT_SAMPLES: "Auto",
+                                        64: "64", 128: "128", 256: "256",
+                                        512: "512", 1024: "1024", 2048: "2048", 4096: "4096"})
 DEFAULT_FFT_SAMPLES = ADAPTIVE_FFT_SAMPLES
 MAX_FFT_SAMPLES = 4096      # Must correspond to the maximum in the dictionary above.
 
@@ -40,31 +41,34 @@ MAX_FFT_SAMPLES = 4096      # Must correspond to the maximum in the dictionary a
 # than a high overlap. So default overlap is not too high, and interpolation defaults to quadratic.
 
 ADAPTIVE_FFT_OVERLAP_PERCENT = -1
-FFT_OVERLAP_PERCENT_OPTIONS = {
+FFT_OVERLAP_PERCENT_OPTIONS = MappingProxyType({
     ADAPTIVE_FFT_OVERLAP_PERCENT: "Auto",
-    0: "0", 25: "25", 50: "50", 75: "75", 90: "90", 95: "95"}
+    0: "0", 25: "25", 50: "50", 75: "75", 90: "90", 95: "95"})
+# The overlaps that can be chosen automatically:
+FFT_OVERLAP_PERCENT_VALUES = tuple(k for k in FFT_OVERLAP_PERCENT_OPTIONS if k != ADAPTIVE_FFT_OVERLAP_PERCENT)
 DEFAULT_FFT_OVERLAP_PERCENT = ADAPTIVE_FFT_OVERLAP_PERCENT
 
-INTERPOLATION_OPTIONS = {0: "None", 1: "Linear", 2: "Quadratic", 3: "Cubic"}
+INTERPOLATION_OPTIONS = MappingProxyType({0: "None", 1: "Linear", 2: "Quadratic", 3: "Cubic"})
 DEFAULT_INTERPOLATION = 2       # Linear is fairly smooth and fairly fast,
                                 # and avoids edge artifacts that quadratic generates.
 
 # Note: boxcar window blows up in the calculations involving infinity
-WINDOW_TYPE_OPTIONS = {"hann": "Hann", "hamming": "Hamming", "blackman": "Blackman", "tukey": "Tukey 0.5",
-                       "bartlett": "Bartlett", "flattop": "Flat top", "boxcar": "Rectangular"}
+WINDOW_TYPE_OPTIONS = MappingProxyType({"hann": "Hann", "hamming": "Hamming", "blackman": "Blackman",
+                                        "tukey": "Tukey 0.5", "bartlett": "Bartlett", "flattop": "Flat top",
+                                        "boxcar": "Rectangular"})
                         # ("kaiser", 3): "Kaiser" is recommended in a paper but results in lots of spread.
 DEFAULT_WINDOW_TYPE = "hann"
 
 SPECTROGRAM_TYPE_STANDARD = 0
 SPECTROGRAM_TYPE_REASSIGNMENT = 1
 SPECTROGRAM_TYPE_ADAPTIVE = 2
-SPECTROGRAM_TYPE_OPTIONS = {SPECTROGRAM_TYPE_STANDARD: "Standard",
-                            SPECTROGRAM_TYPE_REASSIGNMENT: "Reassignment",
-                            SPECTROGRAM_TYPE_ADAPTIVE: "Auto based on zoom"}
+SPECTROGRAM_TYPE_OPTIONS = MappingProxyType({SPECTROGRAM_TYPE_STANDARD: "Standard",
+                                             SPECTROGRAM_TYPE_REASSIGNMENT: "Reassignment",
+                                             SPECTROGRAM_TYPE_ADAPTIVE: "Auto based on zoom"})
 DEFAULT_SPECTROGRAM_TYPE = SPECTROGRAM_TYPE_STANDARD
 
 DEFAULT_FFT_WINDOW_PADDING_FACTOR = 1
-FFT_WINDOW_PADDING_FACTOR = {DEFAULT_FFT_WINDOW_PADDING_FACTOR: "1", 2: "2", 4: "4", 8: "8"}
+FFT_WINDOW_PADDING_FACTOR = MappingProxyType({DEFAULT_FFT_WINDOW_PADDING_FACTOR: "1", 2: "2", 4: "4", 8: "8"})
 
 BNC_ADAPTIVE_MODE = 0
 BNC_MANUAL_MODE = 1
@@ -78,6 +82,17 @@ MULTICHANNEL_SINGLE_MODE = 2
 @dataclass
 class GraphSettings:
     """Settings relating to a specific graph panel."""
+
+    # Explicit slots rather than dataclass(slots=True), which needs Python 3.10. This must list all of
+    # the fields below, plus the attributes assigned only in __init__:
+    __slots__ = ("time_range", "zero_based_time", "frequency_range", "show_grid", "show_profile", "window_samples",
+                 "window_overlap", "window_type", "window_padding_factor", "zoom_interpolation",
+                 "colour_mapping_path", "colour_mapping_steps", "do_histogram_normalization", "bnc_adjust_type",
+                 "bnc_background_threshold_percent", "bnc_manual_min", "bnc_manual_max", "show_time_markers",
+                 "show_frequency_markers", "multichannel_mode", "multichannel_channel", "spectrogram_type",
+                 "use_frame_data", "settings_sample_rate",
+                 "_on_app_modified_settings", "_on_user_applied_settings")
+
     time_range: Optional[AxisRange]
     zero_based_time: bool
     frequency_range: Optional[AxisRange]
@@ -104,14 +119,14 @@ class GraphSettings:
     settings_sample_rate: int
 
     def __init__(self,
-                 on_app_modified_settings: Callable[[int], NoReturn],
-                 on_user_applied_settings: Callable[[int], NoReturn],
+                 on_app_modified_settings: Callable[[int], None],
+                 on_user_applied_settings: Callable[[int], None],
                  show_profile=True):
         self.time_range = AxisRange(0, 1)
         self.zero_based_time = True
         self.frequency_range = AxisRange(0, 1)
-        self._on_app_modified_settings: Callable[[int], NoReturn] = on_app_modified_settings  # Call this to signal that the UI needs to refresh.
-        self._on_user_applied_settings: Callable[[int], NoReturn] = on_user_applied_settings  # Call this to signal that the application needs to refresh.
+        self._on_app_modified_settings: Callable[[int], None] = on_app_modified_settings  # Call this to signal that the UI needs to refresh.
+        self._on_user_applied_settings: Callable[[int], None] = on_user_applied_settings  # Call this to signal that the application needs to refresh.
         self.show_grid = True
         self.show_profile = show_profile
         self.window_samples = DEFAULT_FFT_SAMPLES
@@ -131,11 +146,11 @@ class GraphSettings:
         self.use_frame_data = True
         self.settings_sample_rate = 384000           # Dummy value to be replaced when a file is loaded.
 
-    def on_app_modified_settings(self, draw_scope: int = DrawableFrame.DRAW_ALL) -> NoReturn:
+    def on_app_modified_settings(self, draw_scope: int = DrawableFrame.DRAW_ALL) -> None:
         """Signal to the settings UI that the underlying settings values have changed."""
         self._on_app_modified_settings(draw_scope)
 
-    def on_user_applied_settings(self, draw_scope: int = DrawableFrame.DRAW_ALL) -> NoReturn:
+    def on_user_applied_settings(self, draw_scope: int = DrawableFrame.DRAW_ALL) -> None:
         """Signal to the application that the underlying settings values have changed."""
         self._on_user_applied_settings(draw_scope)
 
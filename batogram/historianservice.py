@@ -19,6 +19,7 @@
 # SOFTWARE.
 
 import os.path
+from typing import List, Tuple
 
 
 class HistorianService:
@@ -27,26 +28,23 @@ class HistorianService:
     _MAX_ENTRIES = 5
 
     def __init__(self):
-        self._history = []
+        # Tuples of filename, full path, so that the filenames are only worked out once:
+        self._history: List[Tuple[str, str]] = []
 
     def add_file(self, path):
-        self._history.append(path)
-
-        # Dedupe while preserving order, O(n^2). Reverse so the most recent is kept when there are dupes.
-        new_list = []
-        for item in reversed(self._history):
-            if item not in new_list:
-                new_list.append(item)
-        self._history = [f for f in reversed(new_list)]
+        # The history never contains duplicates, so we just need to move the path to the
+        # most recent end if it is already present:
+        entry = os.path.basename(path), path
+        if entry in self._history:
+            self._history.remove(entry)
+        self._history.append(entry)
 
         # Limit the history we store using LRU:
-        ln = len(self._history)
-        if ln > self._MAX_ENTRIES:
-            self._history = self._history[ln - self._MAX_ENTRIES:ln]
+        del self._history[:-self._MAX_ENTRIES]
 
     def get_history(self):
-        """Get a list of the history with MRU first, in tuples of full path, filename"""
-        return [(os.path.basename(p), p) for p in reversed(self._history)]
+        """Get a list of the history with MRU first, in tuples of filename, full path"""
+        return self._history[::-1]
 
     def is_empty(self):
-        return len(self._history) > 0
+        return not self._history
@@ -1,7 +1,44 @@
+import base64
+import threading
 import tkinter as tk
+from typing import Dict
 
 from batogram import get_asset_path
 
+# Asset images are shared across the application, so that each file is decoded only once:
+_IMAGE_CACHE: Dict[str, tk.PhotoImage] = {}
+# Raw asset file contents, read ahead of time by preload_assets:
+_ASSET_BYTES: Dict[str, bytes] = {}
+
+
+def preload_assets():
+    """Start reading the asset image files in a background thread, so that the disk I/O
+    overlaps with creating the root window. Images are still decoded in the UI thread, when
+    they are first used."""
+
+    def read_all():
+        for path in get_asset_path("").glob("*.png"):
+            try:
+                _ASSET_BYTES[path.name] = path.read_bytes()
+            except OSError:
+                pass    # load_asset_image will try again, and report any error.
+
+    # daemon means that this thread is killed if the main thread exits.
+    threading.Thread(target=read_all, daemon=True, name="AssetPreload").start()
+
+
+def load_asset_image(file_name: str) -> tk.PhotoImage:
+    """Get the shared PhotoImage for an asset file, loading it on first use. This
+    must not be called before the root window has been created."""
+    image = _IMAGE_CACHE.get(file_name)
+    if image is None:
+        data = _ASSET_BYTES.get(file_name)
+        if data is None:
+            data = get_asset_path(file_name).read_bytes()
+        image = tk.PhotoImage(data=base64.b64encode(data))
+        _IMAGE_CACHE[file_name] = image
+    return image
+
 
 class ImageButton(tk.Button):
     _width = 24
@@ -9,10 +46,6 @@ class ImageButton(tk.Button):
 
     def __init__(self, parent, image_file_name: str, command=None):
         # Give the image instance scope to prevent it being garbage collected:
-        self._image = self._load_image(image_file_name)
+        self._image = load_asset_image(image_file_name)
         super().__init__(parent, image=self._image, width=self._width, padx=self._padding, pady=self._padding,
                          relief=tk.RAISED, command=command)
-
-    @staticmethod
-    def _load_image(file_name):
-        return tk.PhotoImage(file=get_asset_path(file_name))
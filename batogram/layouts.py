@@ -18,6 +18,8 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import bisect
+import functools
 import math
 import sys
 import tkinter as tk
@@ -25,8 +27,8 @@ from dataclasses import dataclass
 
 import numpy as np
 
-from typing import Optional, Tuple, List
-from PIL import ImageTk, Image, ImageOps
+from typing import Optional, Tuple, List, Dict
+from PIL import ImageTk, Image
 
 from . import colourmap
 from .common import AxisRange
@@ -36,6 +38,11 @@ AXIS_BG_COLOUR = "#404040"
 AXIS_FG_COLOUR = "white"
 GRID_COLOUR = "#404040"
 
+# Powers of ten covering any tick interval we are likely to need, so that we can find the
+# decade of an interval by bisecting rather than taking logs:
+_DECADE_MIN_EXPONENT = -12
+_DECADES = tuple(10 ** e for e in range(_DECADE_MIN_EXPONENT, 13))
+
 
 class Layout:
     """A Layout is a helper class that knows how to lay out and draw a graph or a part of a graph."""
@@ -61,7 +68,8 @@ class Layout:
     def calculate_ticks(axis_range: AxisRange, multiplier, pixel_range,
                         zero_based_axis: bool =False, target_spacing_pixels=100):
         # Come up with sane values and positions for ticks, based loosely on have a tick
-        # per set number of pixels.
+        # per set number of pixels. Returns parallel lists of tick values and tick pixel
+        # positions, and the decimal places to use for the values.
 
         if zero_based_axis:
             # Offset the time ticks so that they always start at zero:
@@ -73,14 +81,20 @@ class Layout:
 
         # Sanity checks:
         if min_value >= max_value:
-            return [], 0
+            return [], [], 0
         if pixel_range <= 0:
-            return [], 0
+            return [], [], 0
 
         pixels_per_tick = target_spacing_pixels
         raw_span = max_value - min_value
         raw_interval = raw_span * pixels_per_tick / pixel_range
-        scaler = 10 ** (math.floor(math.log10(raw_interval)))
+        if _DECADES[0] <= raw_interval < _DECADES[-1]:
+            i = bisect.bisect_right(_DECADES, raw_interval) - 1
+            exponent = i + _DECADE_MIN_EXPONENT
+            scaler = _DECADES[i]
+        else:
+            exponent = math.floor(math.log10(raw_interval))
+            scaler = 10 ** exponent
         normalized_interval = raw_interval / scaler
         if normalized_interval >= 5:
             rounded_normalized_interval = 5
@@ -89,33 +103,23 @@ class Layout:
         else:
             rounded_normalized_interval = 1
         rounded_interval = rounded_normalized_interval * scaler
-        rounded_min = math.floor(min_value / rounded_interval) * rounded_interval
-
-        tick_values = []
-        t = rounded_min
-        while t < max_value + rounded_interval:
-            if min_value <= t <= max_value:
-                tick_values.append(t)
-            t += rounded_interval
-
-        # We *could* do something smarter with logs. But will we?
-        decimal_places = 0
-        if rounded_interval < 0.0001:
-            decimal_places = 5
-        elif rounded_interval < 0.001:
-            decimal_places = 4
-        elif rounded_interval < 0.01:
-            decimal_places = 3
-        elif rounded_interval < 0.1:
-            decimal_places = 2
-        elif rounded_interval < 1:
-            decimal_places = 1
+
+        # Work out the range of tick indexes directly, rather than stepping through the
+        # values, so that rounding errors don't accumulate. The small tolerance keeps ticks that
+        # land exactly on the ends of the range, where for example 0.7 / 0.1 is 6.999...:
+        first_tick = math.ceil(min_value / rounded_interval - 1e-9)
+        last_tick = math.floor(max_value / rounded_interval + 1e-9)
+        tick_values = [i * rounded_interval for i in range(first_tick, last_tick + 1)]
+
+        # The rounded interval is 1, 2 or 5 times 10 ** exponent, so the exponent tells us how
+        # many decimal places we need, up to a limit of 5:
+        decimal_places = min(max(-exponent, 0), 5)
 
         # print("scaler = {} dps = {}".format(scaler, decimal_places))
 
-        ticks = [(t, int((t - min_value) / (max_value - min_value) * pixel_range + 0.5)) for t in tick_values]
+        tick_pixels = [int((t - min_value) / raw_span * pixel_range + 0.5) for t in tick_values]
 
-        return ticks, decimal_places
+        return tick_values, tick_pixels, decimal_places
 
 
 class GraphLayout(Layout):
@@ -162,11 +166,10 @@ class GraphLayout(Layout):
 
         l, t, r, b = pixel_rect
         if self._x_axis and self._y_axis:
-            vl = self._x_axis.canvas_to_axis(l)
-            vr = self._x_axis.canvas_to_axis(r)
-            vt = self._y_axis.canvas_to_axis(t)
-            vb = self._y_axis.canvas_to_axis(b)
-            return vl, vt, vr, vb
+            x_slope, x_intercept = self._x_axis.get_canvas_to_axis_mapping()
+            y_slope, y_intercept = self._y_axis.get_canvas_to_axis_mapping()
+            return l * x_slope + x_intercept, t * y_slope + y_intercept, \
+                r * x_slope + x_intercept, b * y_slope + y_intercept
         else:
             return None
 
@@ -189,49 +192,76 @@ class GraphLayout(Layout):
         # There may be a right margin to fill, if we are zoomed right out. And
         # rounding errors may result in the image being one pixel short. So, we apply
         # polyfilla around the right and bottom edge.
-        image_height, image_width, _ = image.shape
+        image_height, image_width = image.shape[:2]
         data_area_width, data_area_height = ir - il + 1, ib - it + 1
-        fill_colour: str = colourmap.instance.get_polyfilla_colour()
-        if image_width < data_area_width:
-            delta = data_area_width - image_width
-            canvas.create_rectangle(ir - delta, it, ir, ib, fill=fill_colour, outline=fill_colour)
-        if image_height < data_area_height:
-            delta = data_area_height - image_height
-            canvas.create_rectangle(il, ib - delta, ir, ib, fill=fill_colour, outline=fill_colour)
-
-        inverted_image = Image.fromarray(np.uint8(image)).convert('RGB')
-        pil_image = ImageOps.flip(inverted_image)
-        image = ImageTk.PhotoImage(pil_image)
-        canvas.my_image = image  # Hack to protect the image against garbage collection
-        # (see https://web.archive.org/web/20201111190625id_/http://effbot.org/pyfaq/why-do-my-tkinter-images-not-appear.htm)
-        canvas.create_image(il, it, image=image, anchor='nw')
+        if image_width < data_area_width or image_height < data_area_height:
+            fill_colour: str = colourmap.instance.get_polyfilla_colour()
+            if image_width < data_area_width:
+                delta = data_area_width - image_width
+                canvas.create_rectangle(ir - delta, it, ir, ib, fill=fill_colour, outline=fill_colour)
+            if image_height < data_area_height:
+                delta = data_area_height - image_height
+                canvas.create_rectangle(il, ib - delta, ir, ib, fill=fill_colour, outline=fill_colour)
+
+        # Pipeline steps cache their output arrays and never modify them, so if we are given the same
+        # array as last time (for example, when only the grid has been toggled), the existing
+        # PhotoImage is still good:
+        if getattr(canvas, "my_image_source", None) is image:
+            photo_image = canvas.my_image
+        else:
+            # The image data is bottom up, so it needs flipping vertically. We do that while we are
+            # copying the data anyway, rather than as an extra pass over the image:
+            if image.ndim == 2:
+                # Colour mapped data arrives as packed RGBA values, which PIL can use directly. A negative
+                # ystep makes PIL read the rows bottom up:
+                pil_image = Image.frombuffer('RGBA', (image_width, image_height), image, 'raw', 'RGBA', 0, -1)
+            else:
+                # The phase colour step already supplies uint8, in which case the only copy is the flip:
+                flipped = image[::-1]
+                if flipped.dtype != np.uint8:
+                    flipped = flipped.astype(np.uint8)
+                pil_image = Image.fromarray(np.ascontiguousarray(flipped))
+                if pil_image.mode != 'RGB':
+                    pil_image = pil_image.convert('RGB')
+            image_format = pil_image.mode, pil_image.size
+            if getattr(canvas, "my_image_format", None) == image_format:
+                # Same shape as the last image, so overwrite its pixels rather than creating a new Tk image:
+                photo_image = canvas.my_image
+                photo_image.paste(pil_image)
+            else:
+                photo_image = ImageTk.PhotoImage(pil_image)
+                canvas.my_image = photo_image  # Hack to protect the image against garbage collection
+                # (see https://web.archive.org/web/20201111190625id_/http://effbot.org/pyfaq/why-do-my-tkinter-images-not-appear.htm)
+                canvas.my_image_format = image_format
+            canvas.my_image_source = image  # Holding a reference also means that the identity test above is safe.
+        canvas.create_image(il, it, image=photo_image, anchor='nw')
 
     @staticmethod
     def _draw_graph_line_segments(canvas, data_area, line_segments, colour):
         l, t, r, b = data_area
-        segments, _ = line_segments.shape
-        for i in range(0, segments):
-            x1, y1, x2, y2 = line_segments[i]
-            x1a, y1a, x2a, y2a = x1 + l, b - y1, x2 + l, b - y2
+        # Convert all the segments to canvas coordinates in one go, as Python ints that tkinter can
+        # pass straight through:
+        canvas_segments = np.empty(line_segments.shape, dtype=np.int32)
+        canvas_segments[:, 0::2] = line_segments[:, 0::2] + l
+        canvas_segments[:, 1::2] = b - line_segments[:, 1::2]
+        for x1a, y1a, x2a, y2a in canvas_segments.tolist():
             canvas.create_line(x1a, y1a, x2a, y2a, fill=colour, width=1, smooth=False)
 
     @staticmethod
     def _draw_graph_points(canvas, data_area, points, colour):
         l, t, r, b = data_area
-        rows, columns = points.shape
-        inverted_points = np.zeros_like(points, dtype=np.int16)
-        # Perhaps there is a way to do this without unpacking the and reassembling the array?:
-        for i in range(0, rows):
-            x, y = points[i]
-            inverted_points[i] = x + l, b - y
-        canvas.create_line(*inverted_points.flatten(), fill=colour, width=1, smooth=True)
+        inverted_points = np.empty(points.shape, dtype=np.int16)
+        inverted_points[:, 0] = points[:, 0] + l
+        inverted_points[:, 1] = b - points[:, 1]
+        # Tk accepts the coordinates as a single flat list, which saves unpacking them into arguments:
+        canvas.create_line(inverted_points.ravel().tolist(), fill=colour, width=1, smooth=True)
 
         # Layout._create_rectangle(canvas, l, t, r, b, "#800000")
 
     @staticmethod
     def _draw_x_grid(canvas, x_ticks, data_area):
         l, t, r, b = data_area
-        for _, p in x_ticks:
+        for p in x_ticks:
             if p > 0:  # Don't overwrite the axis.
                 x_pixels = l + p - 1  # The first x-axis tick is actually over the y-axis
                 canvas.create_line(x_pixels, b, x_pixels, t, fill=GRID_COLOUR, width=1, dash=(1, 1))
@@ -239,12 +269,18 @@ class GraphLayout(Layout):
     @staticmethod
     def _draw_y_grid(canvas, y_ticks, data_area):
         l, t, r, b = data_area
-        for v, p in y_ticks:
+        for p in y_ticks:
             if p > 0:  # Don't overwrite the axes.
                 y_pixels = b - p + 1  # The first y-axis tick is actually over the xaxis
                 canvas.create_line(l, y_pixels, r, y_pixels, fill=GRID_COLOUR, width=1, dash=(1, 1))
 
 
+@functools.lru_cache(maxsize=256)
+def _format_tick(value: float, decimal_places: int) -> str:
+    # Tick values repeat from one draw to the next while panning, so remember the labels.
+    return "{:.{}f}".format(value, decimal_places)
+
+
 @dataclass
 class AxisUnit:
     limit: float = sys.float_info.max  # Upper limit for this unit, or sys.float_info.max if it is the default.
@@ -265,12 +301,17 @@ class AxisLayout(Layout):
         self._title = title
         self._hide_text = hide_text
         self._font_name = AXIS_FONT_NAME
+        self._axis_font = (self._font_name, -self._font_height)   # Negative font height is in pixels.
         self._layout()
         self._min_pixel = None
         self._max_pixel = None
+        self._slope = None  # Axis units per pixel, set by draw for canvas_to_axis.
+        self._intercept = None
         self._axis_range: Optional[AxisRange] = None
         self._units: List[AxisUnit] = sorted(units, key=lambda u: u.limit)  # Ascending.
+        self._unit_limits: List[float] = [u.limit for u in self._units]  # For bisecting.
         self._units_to_use: Optional[AxisUnit] = None
+        self._title_text_by_units: Dict[str, str] = {}
 
     def _layout(self):
         # These coordinates increase from 0 on the outside to maximum
@@ -305,13 +346,15 @@ class AxisLayout(Layout):
         # Decide what units to use based on the axis range:
         u = self._get_units(self._axis_range)
 
-        (ticks, decimal_places) = self.calculate_ticks(axis_range, u.scaler, extent,
-                                                       zero_based_axis, target_spacing_pixels=target_spacing_pixels)
+        (tick_values, ticks, decimal_places) = self.calculate_ticks(axis_range, u.scaler, extent,
+                                                                    zero_based_axis,
+                                                                    target_spacing_pixels=target_spacing_pixels)
 
-        # Negative font height is in pixels:
-        axis_font = (self._font_name, -self._font_height)
+        axis_font = self._axis_font
 
-        text: str = "{} ({})".format(self._title, u.units)
+        text = self._title_text_by_units.get(u.units)
+        if text is None:
+            text = self._title_text_by_units[u.units] = "{} ({})".format(self._title, u.units)
 
         if self._orientation == self.ORIENT_VERTICAL:
             Layout._create_rectangle(canvas, x, y, self._size - 1, y + extent, AXIS_BG_COLOUR)
@@ -321,12 +364,12 @@ class AxisLayout(Layout):
             if not self._hide_text:
                 canvas.create_text(x + self._title_start, x + extent / 2, text=text, fill=AXIS_FG_COLOUR,
                                    angle=90, font=axis_font, anchor=tk.N)
-            for v, p in ticks:
+            for v, p in zip(tick_values, ticks):
                 canvas.create_line(x + self._tick_end, y + extent - p, x + self._tick_start, y + extent - p,
                                    fill=AXIS_FG_COLOUR, width=1)
                 if not self._hide_text:
                     canvas.create_text(x + self._scale_start, y + extent - p,
-                                       text="{0:.{dps}f}".format(float(v), dps=decimal_places), angle=90,
+                                       text=_format_tick(float(v), decimal_places), angle=90,
                                        fill=AXIS_FG_COLOUR, font=axis_font, anchor=tk.N)
             self._min_pixel = y + extent  # Pixel that corresponds to the minimum axis value
             self._max_pixel = y
@@ -339,22 +382,30 @@ class AxisLayout(Layout):
                 canvas.create_text(x + extent / 2, y + self._size - self._title_end, text=text,
                                    fill=AXIS_FG_COLOUR,
                                    font=axis_font, anchor=tk.N)
-            for t, p in ticks:
+            for t, p in zip(tick_values, ticks):
                 canvas.create_line(x + p, y + self._size - self._tick_end, x + p, y + self._size - self._tick_start,
                                    fill=AXIS_FG_COLOUR, width=1)
                 if not self._hide_text:
                     canvas.create_text(x + p, y + self._size - self._scale_end,
-                                       text="{0:.{dps}f}".format(float(t), dps=decimal_places), fill=AXIS_FG_COLOUR,
+                                       text=_format_tick(float(t), decimal_places), fill=AXIS_FG_COLOUR,
                                        font=axis_font, anchor=tk.N)
             self._min_pixel = x  # Pixel that corresponds to the minimum axis value
             self._max_pixel = x + extent
 
-        return ticks
+        # Mouse handling converts lots of canvas positions to axis values between draws, so work
+        # out the linear mapping once here:
+        pixel_span = self._max_pixel - self._min_pixel
+        self._slope = (axis_range.max - axis_range.min) / pixel_span if pixel_span != 0 else 0.0
+        self._intercept = axis_range.min - self._min_pixel * self._slope
+
+        return ticks    # Just the pixel positions, which is all that callers need.
 
     def canvas_to_axis(self, p):
-        v = (p - self._min_pixel) / (self._max_pixel - self._min_pixel) * (
-                self._axis_range.max - self._axis_range.min) + self._axis_range.min
-        return v
+        return p * self._slope + self._intercept
+
+    def get_canvas_to_axis_mapping(self) -> Tuple[float, float]:
+        """The slope and intercept that canvas_to_axis applies."""
+        return self._slope, self._intercept
 
     def axis_to_canvas(self, v):
         p = (v - self._axis_range.min) / (self._axis_range.max - self._axis_range.min) * (
@@ -371,14 +422,13 @@ class AxisLayout(Layout):
             return self._units[0]
         else:
             abs_max: float = max(abs(axis_range.min), abs(axis_range.max))
-            # The possible units are already sorted in ascending order.
-            u = self._units[0]  # Avoid a warning.
-            for u in self._units:
-                if abs_max < u.limit:
-                    return u
-            return u
+            # The possible units are already sorted in ascending order, so find the first one
+            # whose limit is greater than the value, or use the last one if there is none:
+            i = bisect.bisect_right(self._unit_limits, abs_max)
+            return self._units[min(i, len(self._units) - 1)]
 
-    _preferred_ms_per_100pixels = [1.0, 2.0, 5.0, 10.0, 20.0, 50.0, 100.0, 200.0, 500.0, 1000.0, 2000.0, 5000.0]
+    # Must be in ascending order, as we bisect it:
+    _preferred_ms_per_100pixels = (1.0, 2.0, 5.0, 10.0, 20.0, 50.0, 100.0, 200.0, 500.0, 1000.0, 2000.0, 5000.0)
 
     def calc_preferred_range(self, sign: int) -> AxisRange:
         """Calculate a preset axis range that is next large (or smaller) than the current range."""
@@ -405,21 +455,19 @@ class AxisLayout(Layout):
         if sign > 0:
             # We want to increase and round the range:
             nudged_ms_per_100pixels = ms_per_100pixels * nudge_factor
-            for preferred in self._preferred_ms_per_100pixels:
-                if nudged_ms_per_100pixels < preferred:
-                    new_ms_per_100pixels = preferred
-                    break
+            # Find the smallest preferred value greater than the nudged value:
+            i = bisect.bisect_right(self._preferred_ms_per_100pixels, nudged_ms_per_100pixels)
+            if i < len(self._preferred_ms_per_100pixels):
+                new_ms_per_100pixels = self._preferred_ms_per_100pixels[i]
             # Otherwise, the range is already larger than the largest, no change.
-            pass
         elif sign < 0:
             # We want to decrease and round the range:
             nudged_ms_per_100pixels = ms_per_100pixels / nudge_factor
-            for preferred in reversed(self._preferred_ms_per_100pixels):
-                if nudged_ms_per_100pixels > preferred:
-                    new_ms_per_100pixels = preferred
-                    break
+            # Find the largest preferred value less than the nudged value:
+            i = bisect.bisect_left(self._preferred_ms_per_100pixels, nudged_ms_per_100pixels) - 1
+            if i >= 0:
+                new_ms_per_100pixels = self._preferred_ms_per_100pixels[i]
             # Otherwise, the range is already smaller than the smallest, no change.
-            pass
 
         new_span = new_ms_per_100pixels * pixel_span / (100.0 * 1000.0)
         # print("Prefered {} -> {}".format(span, new_span))
@@ -490,11 +538,22 @@ class SpectrogramLayout(GraphLayout):
             self._canvas_width - self._y_axis_width - self._margin)
         x_ticks = self._x_axis.draw(canvas, xaxis_x, xaxis_y, xaxis_extent, x_range, zero_based_axis=zero_based_x_axis)
 
+        # The inputs to the last completion, so that we can skip repeating identical work. The canvas
+        # is only cleared by draw, which creates a new completer, so anything drawn by this one
+        # is still there:
+        completed_with = None
+
         # Create a capture that can be used to finish drawing the graph later on, when the image
         # is available:
         def draw_completer(is_memory_limit_hit: bool = False, image=None):
             # width, height = canvas.winfo_width(), canvas.winfo_height()
 
+            nonlocal completed_with
+            if completed_with is not None \
+                    and completed_with[0] == is_memory_limit_hit and completed_with[1] is image:
+                return
+            completed_with = (is_memory_limit_hit, image)
+
             if is_memory_limit_hit:
                 l1, t1, r1, b1 = self._data_area
                 canvas.create_text((l1 + r1) / 2, (t1 + b1) / 2,
@@ -588,7 +647,7 @@ class AmplitudeLayout(GraphLayout):
         Layout._create_rectangle(canvas, *self._get_left_margin(self._y_axis_width), AXIS_BG_COLOUR)
 
         xaxis_x, xaxis_extent = self._y_axis_width - 1, width - self._y_axis_width - self._margin
-        x_ticks, _ = self._x_axis.calculate_ticks(x_range, 1, xaxis_extent, zero_based_x_axis)
+        _, x_ticks, _ = self._x_axis.calculate_ticks(x_range, 1, xaxis_extent, zero_based_x_axis)
 
         # Create a capture that can be used to finish drawing the graph later on, when the image
         # is available:
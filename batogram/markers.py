@@ -18,6 +18,7 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import math
 import tkinter as tk
 from abc import ABC, abstractmethod
 from typing import Tuple, Optional, Callable, Type, List
@@ -30,20 +31,32 @@ MARKER_DRAGGER_COLOUR = "#FFFF00"
 BAND_COLOUR = "#606000"
 MARKER_TEXT_COLOUR = "#FFFF00"
 
-TAN60: float = 1.73  # tan(60), used for drawing triangles.
+TAN60: float = math.tan(math.radians(60))  # Used for drawing triangles.
+_INV_TAN60: float = 1.0 / TAN60
 AXIS_FONT = AXIS_FONT_NAME, -AXIS_FONT_HEIGHT
 LR_DRAG_CURSOR = "sb_h_double_arrow"
 UD_DRAG_CURSOR = "sb_v_double_arrow"
 CLEARANCE_PIXELS = 15
 
+TextLayoutTuple = Tuple[int, int, str, str]  # x, y, text, anchor.
+
+
+def _overflow_triangle(band_pixel_width: RangeTuple) -> Tuple[int, float]:
+    """The midpoint across the band, and the height of the overflow triangle pointing away from it."""
+    w0, w1 = band_pixel_width
+    return (w0 + w1) // 2, abs(w0 - w1) / 1.3
+
 
 class AbstractHelper(ABC):
     def __init__(self, tag_name: str):
         self._band_id: Optional[int] = None
         self._band_text_ids: List[int] = []
+        self._band_text_layout: List[TextLayoutTuple] = []
         self._lower_overflow_id: Optional[int] = None
         self._upper_overflow_id: Optional[int] = None
         self._tag_name: str = tag_name
+        # The band rectangle, text and clipping last drawn, so that redrawing the same thing can be skipped:
+        self._drawn_band: Optional[Tuple[AreaTuple, List[str], Tuple[bool, bool]]] = None
 
     @abstractmethod
     def get_pixel_range(self, rect: AreaTuple) -> RangeTuple:
@@ -62,8 +75,9 @@ class AbstractHelper(ABC):
         raise NotImplementedError()
 
     @abstractmethod
-    def draw_text_impl(self, canvas: "SpectrogramCanvas", band_rect: AreaTuple,
-                       text: List[str], is_clipped: Tuple[bool, bool]) -> List[int]:
+    def layout_text(self, band_rect: AreaTuple, text: List[str],
+                    is_clipped: Tuple[bool, bool]) -> List[TextLayoutTuple]:
+        """Work out where to draw each item of band text, as (x, y, text, anchor)."""
         raise NotImplementedError()
 
     @abstractmethod
@@ -85,35 +99,59 @@ class AbstractHelper(ABC):
 
         # Actually draw it:
         self._band_id = self._draw_band_impl(canvas, band_rect)
-        self._band_text_ids = self.draw_text_impl(canvas, band_rect, text, is_clipped)
+        self._band_text_layout = self.layout_text(band_rect, text, is_clipped)
+        self._band_text_ids = self._draw_text_impl(canvas, self._band_text_layout)
 
         # Draw overflow symbols if either end of the band is outside the range of the axis:
         self.draw_overflows(canvas, band_pixel_width, band_pixel_length, axis_pixel_range)
 
+        self._drawn_band = band_rect, text, is_clipped
+
         return band_rect, is_clipped
 
     def redraw_band(self, canvas: "SpectrogramCanvas", band_rect: AreaTuple,
                     text: List[str], is_clipped: Tuple[bool, bool]):
         """Redraw an existing band, as a result of an end marker being moved."""
 
-        # Create the new canvas widgets, then delete the existing ones. This allows us to layer
-        # the new ones relative to the existing ones.
+        drawn_band = band_rect, text, is_clipped
+        if drawn_band == self._drawn_band:
+            return
+        self._drawn_band = drawn_band
 
-        new_band_id = self._draw_band_impl(canvas, band_rect)
-        new_text_ids = self.draw_text_impl(canvas, band_rect, text, is_clipped)
+        # Update the existing canvas items in place where we can. As well as being cheaper than
+        # creating new ones, this leaves them where they are in the layering order.
 
-        to_delete = [self._band_id, self._lower_overflow_id, self._upper_overflow_id]
-        to_delete.extend(self._band_text_ids)
+        if self._band_id is not None:
+            canvas.coords(self._band_id, *band_rect)
+        else:
+            self._band_id = self._draw_band_impl(canvas, band_rect)
+
+        to_delete = [item for item in (self._lower_overflow_id, self._upper_overflow_id) if item is not None]
+
+        text_layout = self.layout_text(band_rect, text, is_clipped)
+        if len(text_layout) == len(self._band_text_ids):
+            for text_id, (x, y, s, anchor), old_layout in zip(self._band_text_ids, text_layout,
+                                                              self._band_text_layout):
+                if (x, y) != old_layout[:2]:
+                    canvas.coords(text_id, x, y)
+                if (s, anchor) != old_layout[2:]:
+                    canvas.itemconfigure(text_id, text=s, anchor=anchor)
+        else:
+            # The number of text items has changed, so start afresh with them:
+            to_delete.extend(self._band_text_ids)
+            self._band_text_ids = self._draw_text_impl(canvas, text_layout)
+        self._band_text_layout = text_layout
 
-        # Move it beneath any existing band, before we delete the existing one, to preserve layering order:
-        if self._band_id is not None and new_band_id is not None:
-            canvas.tag_lower(new_band_id, self._band_id)
+        # Delete all the old things in a single Tk command:
+        if to_delete:
+            canvas.delete(*to_delete)
 
-        # Delete all the old things:
-        [canvas.delete(item) for item in to_delete if item is not None]
+        self._lower_overflow_id = self._upper_overflow_id = None
 
-        self._band_id = new_band_id
-        self._band_text_ids = new_text_ids
+    @staticmethod
+    def _draw_text_impl(canvas: "SpectrogramCanvas", text_layout: List[TextLayoutTuple]) -> List[int]:
+        return [canvas.create_text(x, y, text=s, fill=MARKER_TEXT_COLOUR, font=AXIS_FONT, anchor=anchor)
+                for x, y, s, anchor in text_layout]
 
     def _draw_band_impl(self, canvas: "SpectrogramCanvas", band_rect: AreaTuple) -> RangeTuple:
         band_id = canvas.create_rectangle(*band_rect, fill=BAND_COLOUR, outline=BAND_COLOUR,
@@ -143,32 +181,30 @@ class TimeHelper(AbstractHelper):
         # Make sure the band length is at least 1, so there is always something to draw. This makes
         # other code simpler.
         lower, upper = band_pixel_length
-        lower_clipped, upper_clipped = False, False
-
-        if lower < axis_pixel_range[0]:
-            lower = axis_pixel_range[0]
-            lower_clipped = True
-        if upper > axis_pixel_range[1]:
-            upper = axis_pixel_range[1]
-            upper_clipped = True
+        axis_lower, axis_upper = axis_pixel_range
+
+        lower_clipped = lower < axis_lower
+        upper_clipped = upper > axis_upper
+        lower = axis_lower if lower_clipped else lower
+        upper = axis_upper if upper_clipped else upper
         if upper <= lower:
             upper = lower + 1
 
         return (lower, band_pixel_width[1], upper, band_pixel_width[0]), (lower_clipped, upper_clipped)
 
-    def draw_text_impl(self, canvas: "SpectrogramCanvas", band_rect: AreaTuple,
-                       text: List[str], is_clipped: Tuple[bool, bool]) -> List[int]:
+    def layout_text(self, band_rect: AreaTuple, text: List[str],
+                    is_clipped: Tuple[bool, bool]) -> List[TextLayoutTuple]:
+        if not text or is_clipped[0] or is_clipped[1]:
+            return []
+
         l, t, r, b = band_rect
-        text_id = None
-        if len(text) > 0 and not is_clipped[0] and not is_clipped[1]:
-            text_id = None
-            min_space_for_text = 60
-            if r - l > min_space_for_text:
-                # Annotation. +2 to get the text inside the band. Me neither.
-                text_id = canvas.create_text(int((l + r) / 2), int((b + t) / 2 + 2), text=text[0],
-                                             fill=MARKER_TEXT_COLOUR, font=AXIS_FONT, anchor=tk.CENTER)
+        min_space_for_text = 60
+        if r - l <= min_space_for_text:
+            return []
 
-        return [text_id]
+        # Annotation. +2 to get the text inside the band. Me neither. Pixel coordinates are
+        # non-negative ints, so integer division gives the same midpoints as truncation:
+        return [((l + r) // 2, (b + t) // 2 + 2, text[0], tk.CENTER)]
 
     def draw_overflows(self, canvas: "SpectrogramCanvas", band_pixel_width: RangeTuple,
                        band_pixel_length: RangeTuple, axis_pixel_range: RangeTuple):
@@ -180,15 +216,17 @@ class TimeHelper(AbstractHelper):
     @staticmethod
     def _draw_lower_overflow(canvas: "SpectrogramCanvas", p: int, band_pixel_width: RangeTuple) -> int:
         w0, w1 = band_pixel_width
+        mid, height = _overflow_triangle(band_pixel_width)
         return canvas.create_polygon(
-            p, w0, p - abs(w0 - w1) / 1.3, int((w0 + w1) / 2), p, w1,
+            p, w0, p - height, mid, p, w1,
             fill=MARKER_DRAGGER_COLOUR, outline=MARKER_DRAGGER_COLOUR)
 
     @staticmethod
     def _draw_upper_overflow(canvas: "SpectrogramCanvas", p: int, band_pixel_width: RangeTuple) -> int:
         w0, w1 = band_pixel_width
+        mid, height = _overflow_triangle(band_pixel_width)
         return canvas.create_polygon(
-            p, w0, p + abs(w0 - w1) / 1.3, int((w0 + w1) / 2), p, w1,
+            p, w0, p + height, mid, p, w1,
             fill=MARKER_DRAGGER_COLOUR, outline=MARKER_DRAGGER_COLOUR)
 
 
@@ -201,13 +239,10 @@ class FrequencyHelper(AbstractHelper):
     def get_pixel_range(self, rect: AreaTuple) -> RangeTuple:
         """Get the range of pixel values corresponding to axis range."""
 
-        # In the order that matches the axis low and high value:
-        lower, upper = rect[1], rect[3]
-        if lower < upper:
-            temp = lower
-            lower = upper
-            upper = temp
-        return lower, upper
+        # In the order that matches the axis low and high value, which for frequency means
+        # the larger pixel value first:
+        a, b = rect[1], rect[3]
+        return (a, b) if a >= b else (b, a)
 
     def get_line_span(self, rect: AreaTuple) -> RangeTuple:
         """Get the range of pixel values corresponding to the line we well draw.."""
@@ -219,33 +254,32 @@ class FrequencyHelper(AbstractHelper):
         # Make sure the band length is at least 1, so there is always something to draw. This makes
         # other code simpler.
         lower, upper = band_pixel_length
-        lower_clipped, upper_clipped = False, False
-
-        if lower > axis_pixel_range[0]:
-            lower = axis_pixel_range[0]
-            lower_clipped = True
-        if upper < axis_pixel_range[1]:
-            upper = axis_pixel_range[1]
-            upper_clipped = True
+        axis_lower, axis_upper = axis_pixel_range
+
+        # Pixel values decrease with frequency:
+        lower_clipped = lower > axis_lower
+        upper_clipped = upper < axis_upper
+        lower = axis_lower if lower_clipped else lower
+        upper = axis_upper if upper_clipped else upper
         if upper >= lower:
             upper = lower - 1
 
         return (band_pixel_width[0], lower, band_pixel_width[1], upper), (lower_clipped, upper_clipped)
 
-    def draw_text_impl(self, canvas: "SpectrogramCanvas", band_rect: AreaTuple,
-                       text: List[str], is_clipped: Tuple[bool, bool]) -> List[int]:
-        text_ids = []
-        if len(text) == 2:
-            l, t, r, b = band_rect
-            delta = 2  # Avoid crowding.
-            if not is_clipped[0]:
-                text_ids.append(canvas.create_text(l - delta, t, text=text[0],
-                                                   fill=MARKER_TEXT_COLOUR, font=AXIS_FONT, anchor=tk.SE))
-            if not is_clipped[1]:
-                text_ids.append(canvas.create_text(l - delta, b, text=text[1],
-                                                   fill=MARKER_TEXT_COLOUR, font=AXIS_FONT, anchor=tk.SE))
-
-        return text_ids
+    def layout_text(self, band_rect: AreaTuple, text: List[str],
+                    is_clipped: Tuple[bool, bool]) -> List[TextLayoutTuple]:
+        if len(text) != 2:
+            return []
+
+        text_layout = []
+        l, t, r, b = band_rect
+        delta = 2  # Avoid crowding.
+        if not is_clipped[0]:
+            text_layout.append((l - delta, t, text[0], tk.SE))
+        if not is_clipped[1]:
+            text_layout.append((l - delta, b, text[1], tk.SE))
+
+        return text_layout
 
     def draw_overflows(self, canvas: "SpectrogramCanvas", band_pixel_width: RangeTuple,
                        band_pixel_length: RangeTuple, axis_pixel_range: RangeTuple):
@@ -257,18 +291,20 @@ class FrequencyHelper(AbstractHelper):
     @staticmethod
     def _draw_lower_overflow(canvas: "SpectrogramCanvas", p: int, band_pixel_width: RangeTuple) -> int:
         w0, w1 = band_pixel_width
+        mid, height = _overflow_triangle(band_pixel_width)
         return canvas.create_polygon(
             w0, p,
-            int((w0 + w1) / 2), p + abs(w0 - w1) / 1.3,
+            mid, p + height,
             w1, p,
             fill=MARKER_DRAGGER_COLOUR, outline=MARKER_DRAGGER_COLOUR)
 
     @staticmethod
     def _draw_upper_overflow(canvas: "SpectrogramCanvas", p: int, band_pixel_width: RangeTuple) -> int:
         w0, w1 = band_pixel_width
+        mid, height = _overflow_triangle(band_pixel_width)
         return canvas.create_polygon(
             w0, p,
-            int((w0 + w1) / 2), p - abs(w0 - w1) / 1.3,
+            mid, p - height,
             w1, p,
             fill=MARKER_DRAGGER_COLOUR, outline=MARKER_DRAGGER_COLOUR)
 
@@ -282,23 +318,28 @@ class AbstractMarker(ABC):
         self._pair = pair
         self._sgf = sgf
         self._tag_name: str = tag_name
+        self._group_tag_name: str = tag_name + "_group"  # Tags the line as well as the dragger, for moving them.
         self._canvas: "SpectrogramCanvas" = canvas
         self._start_event = None
         self._saved_cursor = None
         self._polygon_id = None
         self._line = None
         self._get_other = get_other
+        self._other_marker: Optional["AbstractMarker"] = None  # Resolved from get_other when first needed.
         self._pixel_range: Optional[RangeTuple] = None
         self._axis_range: Optional[AxisRange] = None
+        self._values_per_pixel: float = 0.0
         self._helper: Type[AbstractHelper] = helper
         self._drag_curser = drag_curser
+        self._pending_move_event = None
+        self._move_after_id = None
 
         # The mouse is used to drag the markers:
-        canvas.tag_bind(self._tag_name, "<Enter>", lambda event: self._mouse_enters_dragger(event))
-        canvas.tag_bind(self._tag_name, "<Leave>", lambda event: self._mouse_leaves_dragger(event))
-        canvas.tag_bind(self._tag_name, "<Button-1>", lambda event: self._on_click(event))
-        canvas.tag_bind(self._tag_name, "<B1-Motion>", lambda event: self._on_move(event))
-        canvas.tag_bind(self._tag_name, "<ButtonRelease-1>", lambda event: self._on_release(event))
+        canvas.tag_bind(self._tag_name, "<Enter>", self._mouse_enters_dragger)
+        canvas.tag_bind(self._tag_name, "<Leave>", self._mouse_leaves_dragger)
+        canvas.tag_bind(self._tag_name, "<Button-1>", self._on_click)
+        canvas.tag_bind(self._tag_name, "<B1-Motion>", self._on_move)
+        canvas.tag_bind(self._tag_name, "<ButtonRelease-1>", self._on_release)
 
     @abstractmethod
     def create_drawer(self, marker_rect: AreaTuple, pixel_value: int, line_span: RangeTuple) \
@@ -331,6 +372,11 @@ class AbstractMarker(ABC):
         line_span: RangeTuple = self._helper.get_line_span(data_rect)
         self._axis_range = axis_range
 
+        # Work out the scaling from pixels to axis values once here, as do_move converts
+        # every mouse position:
+        lower, upper = self._pixel_range
+        self._values_per_pixel = (axis_range.max - axis_range.min) / (upper - lower) if upper != lower else 0.0
+
         pixel_value = self._value_to_pixel(self._axis_value)
         self._pixel_value = pixel_value
 
@@ -347,7 +393,7 @@ class AbstractMarker(ABC):
     def _mouse_enters_dragger(self, _):
         # Only if we aren't currently dragging - avoids cursor flicker during the drag.
         if self._start_event is None:
-            self._saved_cursor = self._canvas.config('cursor')[-1]
+            self._saved_cursor = self._canvas.cget('cursor')
             self._canvas.config(cursor=self._drag_curser)
 
     def _mouse_leaves_dragger(self, _):
@@ -367,8 +413,11 @@ class AbstractMarker(ABC):
         # Set the cursor at the canvas level so it doesn't flicker during dragging:
         self._canvas.config(cursor=self._drag_curser)
 
-        # Ask the other marker how much space we have to drag in:
-        self._allowed_range = self._get_other().get_allowed_for_other()
+        # Ask the other marker how much space we have to drag in. The pair's markers never change,
+        # so we only need to look it up once:
+        if self._other_marker is None:
+            self._other_marker = self._get_other()
+        self._allowed_range = self._other_marker.get_allowed_for_other()
 
         # Take control of the mouse away from the canvas:
         self._canvas.preempt_mouse(True)
@@ -376,18 +425,41 @@ class AbstractMarker(ABC):
     def _on_move(self, event):
         # print("TimeMarker._on_move: {}".format(event))
 
+        # Motion events can arrive much faster than we can redraw the band, so just note the
+        # latest one and deal with it when Tk is next idle:
+        self._pending_move_event = event
+        if self._move_after_id is None:
+            self._move_after_id = self._canvas.after_idle(self._flush_move)
+
+    def _flush_move(self):
+        self._move_after_id = None
+        event, self._pending_move_event = self._pending_move_event, None
+        if event is not None and self._start_event is not None:
+            self._move_to(event)
+
+    def _move_to(self, event):
         # Event contains the coordinate of the current mouse position, not a delta.
 
         pixel_resulting = self._calc_dragged(event)
         # print("pixel_resulting = {}".format(x_resulting))
 
+        # Nothing to move or redraw if the mouse hasn't moved by a whole pixel along the axis:
+        if pixel_resulting == self._pixel_value:
+            return
+
         self.do_move(pixel_resulting)
 
     def _on_release(self, event):
         # print("_on_release: {}".format(event))
 
+        # The release position supersedes any move still waiting to be processed:
+        if self._move_after_id is not None:
+            self._canvas.after_cancel(self._move_after_id)
+            self._move_after_id = None
+        self._pending_move_event = None
+
         # In case we somehow miss the last move:
-        self._on_move(event)
+        self._move_to(event)
 
         # Reset ready for another drag:
         self._allowed_range = None
@@ -425,12 +497,6 @@ class AbstractMarker(ABC):
         p = int((v - self._axis_range.min) / (self._axis_range.max - self._axis_range.min) * (upper - lower) + lower)
         return p
 
-    def _pixel_to_value(self, p: int) -> float:
-        """Convert the supplied pixel value to an axis value."""
-        lower, upper = self._pixel_range
-        v = (p - lower) / (upper - lower) * (self._axis_range.max - self._axis_range.min) + self._axis_range.min
-        return v
-
 
 class TimeMarker(AbstractMarker, ABC):
     def __init__(self, canvas: "SpectrogramCanvas", pair: "Type[AbstractMarkerPair]", sgf: "SpectrogramGraphFrame",
@@ -444,37 +510,41 @@ class TimeMarker(AbstractMarker, ABC):
         dragger_height = int(abs(marker_t - marker_b) / 2)
         line_lower, line_upper = line_span
 
+        # The dragger position is fixed for this draw, so work out its outline up front:
+        w = int(dragger_height * _INV_TAN60)
+        dragger_coords = (pixel_value, marker_b,
+                          pixel_value + w, marker_b - dragger_height,
+                          pixel_value - w, marker_b - dragger_height)
+
         # Create a closure to actually draw the marker:
         def drawer() -> int:
             lower, upper = self._pixel_range
             if lower < pixel_value < upper:
                 self._line = self._canvas.create_line(pixel_value, line_lower, pixel_value, line_upper,
-                                                      fill=MARKER_COLOUR, width=1, dash=(2, 2))
+                                                      fill=MARKER_COLOUR, width=1, dash=(2, 2),
+                                                      tags=[self._group_tag_name])
 
                 # Draw the dragger:
                 self._polygon_id = None
-                w = int(dragger_height / TAN60)
                 self._polygon_id = self._canvas.create_polygon(
-                    pixel_value, marker_b,
-                    pixel_value + w, marker_b - dragger_height,
-                    pixel_value - w, marker_b - dragger_height,
+                    dragger_coords,
                     fill=MARKER_DRAGGER_COLOUR,
                     outline=MARKER_DRAGGER_COLOUR,
-                    tags=[self._tag_name])
+                    tags=[self._tag_name, self._group_tag_name])
 
                 return self._polygon_id
 
         return drawer, (marker_b, marker_b - dragger_height)
 
     def do_move(self, x_current: int):
-        # Move the dragger object in the canvas, using the intrinsic move method
-        # which presumably is the most efficient way:
+        # Move the dragger object and line in the canvas, using the intrinsic move method
+        # which presumably is the most efficient way. The shared tag moves both in one go:
         x_previous = self._pixel_value
         dx = x_current - x_previous
-        self._canvas.move(self._polygon_id, dx, 0)
-        self._canvas.move(self._line, dx, 0)
+        self._canvas.move(self._group_tag_name, dx, 0)
         self._pixel_value = x_current
-        self._axis_value = self._pixel_to_value(x_current)
+        # Convert to an axis value inline, as this happens on every drag step:
+        self._axis_value = (x_current - self._pixel_range[0]) * self._values_per_pixel + self._axis_range.min
 
     def get_pixels_dragged(self, event, start_event):
         return event.x - start_event.x
@@ -523,37 +593,41 @@ class FrequencyMarker(AbstractMarker, ABC):
         dragger_width = int(abs(marker_r - marker_l) / 2)
         line_lower, line_upper = line_span
 
+        # The dragger position is fixed for this draw, so work out its outline up front:
+        w = int(dragger_width * _INV_TAN60)
+        dragger_coords = (marker_l, pixel_value,
+                          marker_l + dragger_width, pixel_value + w,
+                          marker_l + dragger_width, pixel_value - w)
+
         # Create a closure to actually draw the marker:
         def drawer() -> int:
             lower, upper = self._pixel_range
             if lower > pixel_value > upper:  # TODO dupe
                 self._line = self._canvas.create_line(line_lower, pixel_value, line_upper, pixel_value,
-                                                      fill=MARKER_COLOUR, width=1, dash=(2, 2))
+                                                      fill=MARKER_COLOUR, width=1, dash=(2, 2),
+                                                      tags=[self._group_tag_name])
 
                 # Draw the dragger:
                 self._polygon_id = None
-                w = int(dragger_width / TAN60)
                 self._polygon_id = self._canvas.create_polygon(
-                    marker_l, pixel_value,
-                    marker_l + dragger_width, pixel_value + w,
-                    marker_l + dragger_width, pixel_value - w,
+                    dragger_coords,
                     fill=MARKER_DRAGGER_COLOUR,
                     outline=MARKER_DRAGGER_COLOUR,
-                    tags=[self._tag_name])
+                    tags=[self._tag_name, self._group_tag_name])
 
                 return self._polygon_id
 
         return drawer, (marker_l, marker_l + dragger_width)
 
     def do_move(self, pixel_current: int):
-        # Move the dragger object in the canvas, using the intrinsic move method
-        # which presumably is the most efficient way:
+        # Move the dragger object and line in the canvas, using the intrinsic move method
+        # which presumably is the most efficient way. The shared tag moves both in one go:
         pixel_previous = self._pixel_value
         delta = pixel_current - pixel_previous
-        self._canvas.move(self._polygon_id, 0, delta)
-        self._canvas.move(self._line, 0, delta)
+        self._canvas.move(self._group_tag_name, 0, delta)
         self._pixel_value = pixel_current
-        self._axis_value = self._pixel_to_value(pixel_current)
+        # Convert to an axis value inline, as this happens on every drag step:
+        self._axis_value = (pixel_current - self._pixel_range[0]) * self._values_per_pixel + self._axis_range.min
 
     def get_pixels_dragged(self, event, start_event):
         return event.y - start_event.y
@@ -605,6 +679,9 @@ class AbstractMarkerPair(ABC):
         self._helper: Type[AbstractHelper] = helper
         self._band_rect: Optional[AreaTuple] = None
         self._is_clipped: Tuple[bool, bool] = False, False
+        # The marker values that the band text was last formatted for, and the text:
+        self._band_text_for: Optional[Tuple[float, float]] = None
+        self._band_text: List[str] = []
 
     def set_positions(self, positions: Tuple[Optional[float], Optional[float]]):
         v_lower, v_upper = positions
@@ -692,13 +769,15 @@ class TimeMarkerPair(AbstractMarkerPair):
         """Text to display on a time band: the time range."""
         v_left = self._lower_marker.get_axis_value()
         v_right = self._upper_marker.get_axis_value()
-        v_span = v_right - v_left
-        if v_span < 0.1:
-            text = "{0:.1f} ms".format(v_span * 1000)
-        else:
-            text = "{0:.3f} s".format(v_span)
+        if (v_left, v_right) != self._band_text_for:
+            v_span = v_right - v_left
+            if v_span < 0.1:
+                text = "{0:.1f} ms".format(v_span * 1000)
+            else:
+                text = "{0:.3f} s".format(v_span)
+            self._band_text_for, self._band_text = (v_left, v_right), [text]
 
-        return [text]
+        return self._band_text
 
 
 class FrequencyMarkerPair(AbstractMarkerPair):
@@ -728,6 +807,9 @@ class FrequencyMarkerPair(AbstractMarkerPair):
         """Text to display on a time band: the freqeuencies."""
         f_lower = self._lower_marker.get_axis_value()
         f_upper = self._upper_marker.get_axis_value()
-        t_lower = "{0:.1f} kHz".format(f_lower / 1000)
-        t_upper = "{0:.1f} kHz".format(f_upper / 1000)
-        return [t_lower, t_upper]
+        if (f_lower, f_upper) != self._band_text_for:
+            t_lower = "{0:.1f} kHz".format(f_lower / 1000)
+            t_upper = "{0:.1f} kHz".format(f_upper / 1000)
+            self._band_text_for, self._band_text = (f_lower, f_upper), [t_lower, t_upper]
+
+        return self._band_text
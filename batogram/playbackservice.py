@@ -30,6 +30,7 @@ import pyaudio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
+from operator import methodcaller
 
 from threading import Thread, Condition, RLock
 from typing import Type, Tuple, Optional, Callable, List
@@ -130,6 +131,33 @@ class PlaybackEventHandler(PlaybackCursorEventHandler):
 # The event closure is a closure that this class passes back to the invoker:
 EventClosureType = Callable[[Type[PlaybackEventHandler]], None]
 
+
+class CursorUpdateClosure:
+    """
+    An event closure that updates the playback cursor. These are sent frequently during playback,
+    so event processors may recognise this type and discard all but the latest.
+    """
+
+    __slots__ = ("offset",)
+
+    def __init__(self, offset: int):
+        self.offset = offset
+
+    def __call__(self, handler: Type[PlaybackEventHandler]):
+        handler.on_show_update_playback_cursor(self.offset)
+
+
+# Event closures without a payload are created once and reused for every event, rather than
+# allocating a new closure each time:
+_ON_BROADCAST_BUSY_CLOSURE: EventClosureType = methodcaller("on_broadcast_busy")
+_ON_PLAY_STARTED_CLOSURE: EventClosureType = methodcaller("on_play_started")
+_ON_PLAY_PAUSED_CLOSURE: EventClosureType = methodcaller("on_play_paused")
+_ON_PLAY_RESUMED_CLOSURE: EventClosureType = methodcaller("on_play_resumed")
+_ON_PLAY_CANCELLED_CLOSURE: EventClosureType = methodcaller("on_play_cancelled")
+_ON_HIDE_PLAYBACK_CURSOR_CLOSURE: EventClosureType = methodcaller("on_hide_playback_cursor")
+_ON_PLAY_FINISHED_CLOSURE: EventClosureType = methodcaller("on_play_finished")
+_ON_BROADCAST_READY_CLOSURE: EventClosureType = methodcaller("on_broadcast_ready")
+
 # The event processor is a method implement on the invoker, used to send events to it:
 EventProcessorType = Callable[[EventClosureType], None]
 
@@ -372,14 +400,14 @@ class PlaybackServiceImpl(PlaybackService):
 
             try:    # Define a scope for cleaning up.
                 # print("Starting")
-                self._broadcast(event_processor, lambda handler: handler.on_broadcast_busy())
+                self._broadcast(event_processor, _ON_BROADCAST_BUSY_CLOSURE)
 
                 # Select the method based on the user's selection:
                 if request.settings.autoscale:
                     scaler: float = self._get_autoscale_factor(afs, request.sample_range)
                     i_scaler = max(int(1), int(scaler + 0.5))
 
-                event_processor(lambda handler: handler.on_play_started())
+                event_processor(_ON_PLAY_STARTED_CLOSURE)
 
                 # The code below would probably be nicer written as a state machine. Another day.
 
@@ -399,14 +427,14 @@ class PlaybackServiceImpl(PlaybackService):
                             # Doing that resulted in the program freezing; either a deadlock resulting from pyaudio
                             # locking something that tkinter needs, or just a simple pile up of events.
                             offset = self._engine.get_current_offset()
-                            event_processor(lambda handler: handler.on_show_update_playback_cursor(offset))
+                            event_processor(CursorUpdateClosure(offset))
                             try:
                                 self._rlock.release()
                                 time.sleep(0.1)
                             finally:
                                 self._rlock.acquire()
                         if self._pausing:
-                            event_processor(lambda handler: handler.on_play_paused())
+                            event_processor(_ON_PLAY_PAUSED_CLOSURE)
                             # print("Pausing")
                             # Wait for resume, stop or shutdown:
                             while self._pausing and not self._shutting_down and not self._stopping:
@@ -415,7 +443,7 @@ class PlaybackServiceImpl(PlaybackService):
                                     time.sleep(0.1)
                                 finally:
                                     self._rlock.acquire()
-                            event_processor(lambda handler: handler.on_play_resumed())
+                            event_processor(_ON_PLAY_RESUMED_CLOSURE)
                             if not self._shutting_down and not self._stopping:
                                 self._engine.start_stream()
                                 # print("Resuming.")
@@ -425,7 +453,7 @@ class PlaybackServiceImpl(PlaybackService):
                     if self._stopping:
                         # They clicked stop.
                         # print("Stopping")
-                        event_processor(lambda handler: handler.on_play_cancelled)
+                        event_processor(_ON_PLAY_CANCELLED_CLOSURE)
                         self._stopping = False
                         terminating = True
                     else:
@@ -437,9 +465,9 @@ class PlaybackServiceImpl(PlaybackService):
                 self._engine = None
                 engine.finish()
 
-                event_processor(lambda handler: handler.on_hide_playback_cursor())
-                event_processor(lambda handler: handler.on_play_finished())
-                self._broadcast(event_processor, lambda handler: handler.on_broadcast_ready())
+                event_processor(_ON_HIDE_PLAYBACK_CURSOR_CLOSURE)
+                event_processor(_ON_PLAY_FINISHED_CLOSURE)
+                self._broadcast(event_processor, _ON_BROADCAST_READY_CLOSURE)
             finally:
                 afs.close()
                 if request.wave_file:
@@ -36,7 +36,7 @@ from .audiofileservice import AudioFileService, RawDataReader
 from .chunky_spectrogram import chunky_spectrogram
 from .common import AxisRange, AreaTuple, clip_to_range
 from .graphsettings import GraphSettings, ADAPTIVE_FFT_SAMPLES, ADAPTIVE_FFT_OVERLAP_PERCENT, \
-    FFT_OVERLAP_PERCENT_OPTIONS, BNC_ADAPTIVE_MODE, BNC_MANUAL_MODE, BNC_INTERACTIVE_MODE, MULTICHANNEL_SINGLE_MODE, \
+    FFT_OVERLAP_PERCENT_VALUES, BNC_ADAPTIVE_MODE, BNC_MANUAL_MODE, BNC_INTERACTIVE_MODE, MULTICHANNEL_SINGLE_MODE, \
     SPECTROGRAM_TYPE_REASSIGNMENT, SPECTROGRAM_TYPE_STANDARD, SPECTROGRAM_TYPE_ADAPTIVE
 from .stegangraphy import LSBSteganography
 from hsluv import hsluv_to_rgb
@@ -510,10 +510,9 @@ class SpectrogramCalcData:
         overlap_percentage = clip_to_range(overlap_percentage, 0.0, 95.0)
 
         # Round the required overlap to the nearest available option:
-        items = [(k, v) for k, v in FFT_OVERLAP_PERCENT_OPTIONS.items() if k != ADAPTIVE_FFT_OVERLAP_PERCENT]
-        rounded, _ = items[0]
+        rounded = FFT_OVERLAP_PERCENT_VALUES[0]
         delta = abs(rounded - overlap_percentage)
-        for k, v in items[1:]:
+        for k in FFT_OVERLAP_PERCENT_VALUES[1:]:
             this_delta = abs(k - overlap_percentage)
             if this_delta < delta:
                 rounded = k
@@ -1283,7 +1282,9 @@ class SpectrogramBNCStep(PipelineStep, BnCHelper):
 
 
 class SpectrogramApplyColourMapStep(PipelineStep):
-    """Replace each value in the supplied data with an RGB colour"""
+    """Replace each value in the supplied data with a colour, as a 2D array of packed little endian RGBA
+    uint32 values the same shape as the data. The bytes of each value are in R, G, B, A order, so the result
+    can be used as raw RGBA image data."""
 
     def __init__(self, settings: GraphSettings):
         super().__init__(settings)
@@ -1303,7 +1304,7 @@ class SpectrogramApplyColourMapStep(PipelineStep):
     def _implementation(self, inputdata, params):
         previous_serial, = params
         # s = self.get_relevant_settings()
-        outputdata = colourmap.instance.map(inputdata)
+        outputdata = colourmap.instance.map_rgba(inputdata)
         return outputdata
 
 
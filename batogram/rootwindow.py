@@ -50,7 +50,7 @@ from .moreframe import MoreTopFrame
 from .spectrogramgraphframe import SpectrogramGraphFrame
 from .wavfileparser import WavFileError
 from .about import AboutWindow
-from . import get_asset_path
+from .imagebutton import preload_assets, load_asset_image
 from .browserframe import BrowserFrame, FolderWalker
 
 # One day, we will define the menus using a table including shortcuts and underlined letters:
@@ -523,6 +523,8 @@ class RootWindow(tk.Tk):
     """The top level application window."""
 
     def __init__(self, *args, initialfile=None, **kwargs):
+        # Read the button images while Tk starts up:
+        preload_assets()
         super().__init__(*args, **kwargs)
 
         self._inner_paned_window: tk.PanedWindow
@@ -560,7 +562,7 @@ class RootWindow(tk.Tk):
 
         # Define the initial window position and size:
         self.geometry("900x700+100+100")
-        self.iconphoto(True, tk.PhotoImage(file=get_asset_path("batogram.png")))
+        self.iconphoto(True, load_asset_image("batogram.png"))
 
         self.protocol("WM_DELETE_WINDOW", self.exit)
 
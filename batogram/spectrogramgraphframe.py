@@ -621,34 +621,34 @@ class SpectrogramGraphFrame(GraphFrame, PlaybackCursorEventHandler):
         self._settings.on_app_modified_settings()
         axis_time, _ = self._layout.canvas_to_axis(canvas_pos)
         self._pending_time_marker_positions = axis_time, None
-        self.draw()
+        self.request_draw()
 
     def on_place_right_marker(self, canvas_pos: Tuple[int, int]):
         self._settings.show_time_markers = True
         self._settings.on_app_modified_settings()
         axis_time, _ = self._layout.canvas_to_axis(canvas_pos)
         self._pending_time_marker_positions = None, axis_time
-        self.draw()
+        self.request_draw()
 
     def on_place_top_marker(self, canvas_pos: Tuple[int, int]):
         self._settings.show_frequency_markers = True
         self._settings.on_app_modified_settings()
         _, axis_frequency = self._layout.canvas_to_axis(canvas_pos)
         self._pending_frequency_marker_positions = None, axis_frequency
-        self.draw()
+        self.request_draw()
 
     def on_place_bottom_marker(self, canvas_pos: Tuple[int, int]):
         self._settings.show_frequency_markers = True
         self._settings.on_app_modified_settings()
         _, axis_frequency = self._layout.canvas_to_axis(canvas_pos)
         self._pending_frequency_marker_positions = axis_frequency, None
-        self.draw()
+        self.request_draw()
 
     def on_hide_markers(self):
         self._settings.show_time_markers = False
         self._settings.show_frequency_markers = False
         self._settings.on_app_modified_settings()
-        self.draw()
+        self.request_draw()
 
     def mark_region(self, region: Tuple[int, int, int, int], drag_mode: DragMode):
         # Convert the drag region pixels to axis values:
@@ -666,7 +666,7 @@ class SpectrogramGraphFrame(GraphFrame, PlaybackCursorEventHandler):
             self._pending_frequency_marker_positions = f2, f1  # Axis value ordering is oppostie to pixel value ordering.
 
         self._settings.on_app_modified_settings()
-        self.draw()
+        self.request_draw()
 
     def on_show_update_playback_cursor(self, offset: int):
         # Note any existing line id, and delete it after drawing the new one, for smoothness.